@@ -1,11 +1,31 @@
+import asyncio
 import base64
+import re
+import shutil
+import socket
 import warnings
-from typing import Any, Callable, Dict, Iterator, List, Optional, Type, Union
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 from uuid import UUID
 
-import sseclient
 from pydantic import TypeAdapter
 from requests import HTTPError, Response
+from requests.exceptions import ChunkedEncodingError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import ContentDecodingError
+from requests.exceptions import SSLError as RequestsSSLError
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError, SSLError
 
 from alpaca.broker.enums import ACHRelationshipStatus
 from alpaca.broker.models import (
@@ -55,6 +75,8 @@ from alpaca.common import RawData
 from alpaca.common.constants import (
     ACCOUNT_ACTIVITIES_DEFAULT_PAGE_SIZE,
     BROKER_DOCUMENT_UPLOAD_LIMIT,
+    CALENDAR_CACHE_TTL_SECONDS,
+    DOWNLOAD_CHUNK_SIZE,
 )
 from alpaca.common.enums import BaseURL, PaginationType
 from alpaca.common.exceptions import APIError
@@ -119,6 +141,200 @@ from .requests import (
     UploadW8BenDocumentRequest,
 )
 
+# TypeAdapter builds a pydantic-core validator when constructed, so build the ones used on every call just once
+_ACCOUNT_ADAPTER = TypeAdapter(Account)
+_ACCOUNT_LIST_ADAPTER = TypeAdapter(List[Account])
+_TRADE_ACCOUNT_CONFIGURATION_ADAPTER = TypeAdapter(TradeAccountConfiguration)
+_TRADE_DOCUMENT_ADAPTER = TypeAdapter(TradeDocument)
+_TRADE_DOCUMENT_LIST_ADAPTER = TypeAdapter(List[TradeDocument])
+_ACH_RELATIONSHIP_LIST_ADAPTER = TypeAdapter(List[ACHRelationship])
+_BANK_LIST_ADAPTER = TypeAdapter(List[Bank])
+_TRADE_ACTIVITY_ADAPTER = TypeAdapter(TradeActivity)
+_NON_TRADE_ACTIVITY_ADAPTER = TypeAdapter(NonTradeActivity)
+_TRANSFER_LIST_ADAPTER = TypeAdapter(List[Transfer])
+_POSITION_ADAPTER = TypeAdapter(Position)
+_POSITION_LIST_ADAPTER = TypeAdapter(List[Position])
+_CLOSE_POSITION_RESPONSE_LIST_ADAPTER = TypeAdapter(List[ClosePositionResponse])
+_CLOCK_ADAPTER = TypeAdapter(Clock)
+_CALENDAR_LIST_ADAPTER = TypeAdapter(List[Calendar])
+_WATCHLIST_LIST_ADAPTER = TypeAdapter(List[Watchlist])
+_BATCH_JOURNAL_RESPONSE_LIST_ADAPTER = TypeAdapter(List[BatchJournalResponse])
+_JOURNAL_LIST_ADAPTER = TypeAdapter(List[Journal])
+_ASSET_ADAPTER = TypeAdapter(Asset)
+_ASSET_LIST_ADAPTER = TypeAdapter(List[Asset])
+_ORDER_ADAPTER = TypeAdapter(Order)
+_ORDER_LIST_ADAPTER = TypeAdapter(List[Order])
+_CANCEL_ORDER_RESPONSE_LIST_ADAPTER = TypeAdapter(List[CancelOrderResponse])
+_PORTFOLIO_LIST_ADAPTER = TypeAdapter(List[Portfolio])
+_CORPORATE_ACTION_ANNOUNCEMENT_LIST_ADAPTER = TypeAdapter(
+    List[CorporateActionAnnouncement]
+)
+
+_TRADE_ACTIVITY_TYPES = frozenset(
+    activity_type.value
+    for activity_type in ActivityType
+    if ActivityType.is_str_trade_activity(activity_type.value)
+)
+
+
+@lru_cache(maxsize=256)
+def _trading_account_path(account_id: UUID) -> str:
+    """
+    Returns the "/trading/accounts/{account_id}" prefix shared by the trading routes. Bots tend to hit the same few
+    accounts over and over, so the UUID is only formatted once per account.
+    """
+    return f"/trading/accounts/{account_id}"
+
+
+def _call(call: Callable[[], Any]) -> Any:
+    return call()
+
+
+def _call_returning_exception(call: Callable[[], Any]) -> Any:
+    """Runs one of the calls given to `BrokerClient.bulk`, handing back what it raised instead of raising it."""
+    try:
+        return call()
+    except Exception as e:
+        return e
+
+
+# sent on top of the default headers when subscribing to one of the event streams
+_SSE_HEADERS = {
+    "Connection": "keep-alive",
+    "Cache-Control": "no-cache",
+    "Content-Type": "text/event-stream",
+    "Accept": "text/event-stream",
+}
+
+# blank line that terminates an event, see https://html.spec.whatwg.org/multipage/server-sent-events.html
+_SSE_EVENT_TERMINATOR = re.compile(rb"\r\n\r\n|\n\n|\r\r")
+
+
+def _iter_response_chunks(response: Response) -> Iterator[bytes]:
+    """
+    Yields the body of a streamed response in chunks as they arrive.
+
+    With urllib3 2.2+ the underlying response is read directly with read1, which returns whatever is available instead
+    of waiting for a full buffer, skipping the generators requests and urllib3 wrap around it in iter_content. The
+    urllib3 errors are re-raised as the requests exceptions iter_content would raise, so a dropped stream still
+    surfaces as a RequestException.
+    """
+    raw = getattr(response, "raw", None)
+    read1 = getattr(raw, "read1", None)
+
+    if read1 is None:
+        yield from response.iter_content(chunk_size=None)
+        return
+
+    raw.decode_content = True
+
+    try:
+        yield from iter(read1, b"")
+    except ProtocolError as e:
+        raise ChunkedEncodingError(e)
+    except DecodeError as e:
+        raise ContentDecodingError(e)
+    except ReadTimeoutError as e:
+        raise RequestsConnectionError(e)
+    except SSLError as e:
+        raise RequestsSSLError(e)
+
+
+def _interrupt_stream(response: Response) -> None:
+    """
+    Shuts down the socket under a streamed response, which wakes up a read blocked on it in another thread. Closing
+    the response itself would instead wait for that read to finish.
+    """
+    connection = getattr(response.raw, "connection", None)
+    sock = getattr(connection, "sock", None)
+
+    if sock is None:
+        return
+
+    try:
+        sock.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        # already closed or disconnected
+        pass
+
+
+def _close_opened_stream(opening: Future) -> None:
+    """
+    Closes the response of an event stream subscription once the request opening it is done, if it succeeded.
+    """
+    if not opening.cancelled() and opening.exception() is None:
+        opening.result().close()
+
+
+def _iter_sse_events(response: Response) -> Iterator[str]:
+    """
+    Yields the data of each server-sent event in a streamed response as soon as the event is complete.
+
+    Chunks are collected as they arrive and only the new chunk plus the few bytes before it are searched for the blank
+    line ending an event, so the buffer is joined and split once per batch of complete events rather than being
+    rescanned and recopied on every line.
+    """
+    pieces: List[bytes] = []
+    tail = b""
+
+    for chunk in _iter_response_chunks(response):
+        pieces.append(chunk)
+        window = tail + chunk
+        # the longest terminator is 4 bytes, so keeping 3 is enough to catch one split across chunks
+        tail = window[-3:]
+
+        if _SSE_EVENT_TERMINATOR.search(window) is None:
+            continue
+
+        events = _SSE_EVENT_TERMINATOR.split(b"".join(pieces))
+        # whatever follows the last terminator belongs to an event that hasn't fully arrived yet
+        remainder = events.pop()
+        pieces = [remainder]
+        tail = remainder[-3:]
+
+        for event in events:
+            data = _parse_sse_data(event)
+
+            if data is not None:
+                yield data
+
+    if pieces:
+        data = _parse_sse_data(b"".join(pieces))
+
+        if data is not None:
+            yield data
+
+
+def _parse_sse_data(event: bytes) -> Optional[str]:
+    """
+    Returns the joined `data` fields of a single raw server-sent event, or None if it didn't have any. Comments and
+    the other fields are skipped since only the data is passed on to callers.
+    """
+    data = []
+
+    for line in event.splitlines():
+        field, _, value = line.partition(b":")
+
+        if field != b"data":
+            continue
+
+        # a single leading space after the colon is not part of the value
+        data.append(value[1:] if value[:1] == b" " else value)
+
+    if not data:
+        return None
+
+    return b"\n".join(data).decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[BaseModel]) -> TypeAdapter:
+    """
+    Returns a List[model] TypeAdapter for paging helpers that only know the model type at runtime, building it
+    just once per model.
+    """
+    return TypeAdapter(List[model])
+
 
 class BrokerClient(RESTClient):
     """
@@ -148,6 +364,7 @@ class BrokerClient(RESTClient):
         sandbox: bool = True,
         raw_data: bool = False,
         url_override: Optional[str] = None,
+        use_response_cache: bool = True,
     ):
         """
         Args:
@@ -158,6 +375,9 @@ class BrokerClient(RESTClient):
             raw_data (bool): True if you want raw response instead of wrapped responses. Defaults to False.
                 This has not been implemented yet.
             url_override (Optional[str]): A url to override and use as the base url.
+            use_response_cache (bool): Whether the read-mostly routes (accounts, banks, assets, the calendar, ...) may
+              reuse previously received responses via ETags and short lived caching. Set to False to always fetch
+              fresh data. Defaults to True.
         """
         base_url = (
             url_override
@@ -172,14 +392,21 @@ class BrokerClient(RESTClient):
             api_version=api_version,
             sandbox=sandbox,
             raw_data=raw_data,
+            use_response_cache=use_response_cache,
         )
 
-    def _get_auth_headers(self) -> dict:
-        # We override this since we use Basic auth
+        # credentials can't change over the lifetime of the client, so encode the Basic auth value just once
         auth_string = f"{self._api_key}:{self._secret_key}"
-        auth_string_encoded = base64.b64encode(str.encode(auth_string))
+        self._auth_header_value: str = "Basic " + base64.b64encode(
+            auth_string.encode("utf-8")
+        ).decode("utf-8")
 
-        return {"Authorization": "Basic " + auth_string_encoded.decode("utf-8")}
+        # the event streams are reconnected often, so only the route suffix gets appended per subscription
+        self._events_url: str = self._base_url + "/" + self._api_version + "/events"
+
+    def _get_auth_headers(self) -> dict:
+        # We override this since we use Basic auth. A new dict is returned each time since callers add to it.
+        return {"Authorization": self._auth_header_value}
 
     def _iterate_over_pages(
         self,
@@ -217,15 +444,16 @@ class BrokerClient(RESTClient):
                 max_items_limit is not None
                 and num_items_returned + total_items > max_items_limit
             ):
-                result = result[: (max_items_limit - total_items)]
-                total_items += max_items_limit - total_items
+                # truncate in place rather than copying the kept prefix into a new list
+                del result[max_items_limit - total_items :]
+                total_items = max_items_limit
             else:
                 total_items += num_items_returned
 
             if self._use_raw_data:
                 yield result
             else:
-                yield TypeAdapter(type=List[base_model_type]).validate_python(result)
+                yield _list_adapter(base_model_type).validate_python(result)
 
             if max_items_limit is not None and total_items >= max_items_limit:
                 break
@@ -237,6 +465,38 @@ class BrokerClient(RESTClient):
 
             params["page_token"] = page_token
 
+    def bulk(
+        self,
+        calls: List[Callable[[], Any]],
+        max_workers: int = 16,
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """
+        Runs many independent client calls concurrently instead of one after another, sharing the pooled session
+        connections between them. Useful when you need the same data for a large number of accounts.
+
+        Example:
+            ``client.bulk([partial(client.get_banks_for_account, id) for id in account_ids])``
+
+        Args:
+            calls (List[Callable[[], Any]]): Zero argument callables, usually client methods wrapped with
+              `functools.partial`.
+            max_workers (int): The maximum number of requests in flight at once. Defaults to 16.
+            return_exceptions (bool): If true, a call that raises has its exception returned in its place instead,
+              so the results of the other calls aren't lost. Defaults to False.
+
+        Returns:
+            List[Any]: The result of each call, in the same order as `calls`. Unless `return_exceptions` is set, the
+              first exception raised is re-raised once every call has finished.
+        """
+        if len(calls) == 0:
+            return []
+
+        run = _call_returning_exception if return_exceptions else _call
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+            return list(executor.map(run, calls))
+
     # ############################## ACCOUNTS/TRADING ACCOUNTS ################################# #
 
     def create_account(
@@ -255,9 +515,8 @@ class BrokerClient(RESTClient):
         """
 
         data = account_data.to_request_fields()
-        response = self.post("/accounts", data)
 
-        return Account(**response)
+        return self._request_validated("POST", _ACCOUNT_ADAPTER, "/accounts", data)
 
     def get_account_by_id(
         self,
@@ -278,8 +537,9 @@ class BrokerClient(RESTClient):
 
         account_id = validate_uuid_id_param(account_id)
 
-        resp = self.get(f"/accounts/{account_id}", {"params": ""})
-        return Account(**resp)
+        return self._get_validated(
+            _ACCOUNT_ADAPTER, f"/accounts/{account_id}", use_etag=True
+        )
 
     def update_account(
         self,
@@ -307,12 +567,9 @@ class BrokerClient(RESTClient):
         if len(params) < 1:
             raise ValueError("update_data must contain at least 1 field to change")
 
-        response = self.patch(f"/accounts/{account_id}", params)
-
-        if self._use_raw_data:
-            return response
-
-        return Account(**response)
+        return self._request_validated(
+            "PATCH", _ACCOUNT_ADAPTER, f"/accounts/{account_id}", params
+        )
 
     def delete_account(
         self,
@@ -373,20 +630,9 @@ class BrokerClient(RESTClient):
             List[Account]: The filtered list of Accounts
         """
 
-        params = search_parameters.to_request_fields() if search_parameters else {}
-
-        # API expects comma separated for entities not multiple params
-        if "entities" in params and params["entities"] is not None:
-            params["entities"] = ",".join(params["entities"])
-
-        response = self.get(
-            f"/accounts",
-            params,
-        )
+        params = search_parameters.to_request_fields() if search_parameters else None
 
-        if self._use_raw_data:
-            return response
-        return TypeAdapter(List[Account]).validate_python(response)
+        return self._get_validated(_ACCOUNT_LIST_ADAPTER, "/accounts", params)
 
     def get_trade_account_by_id(
         self,
@@ -405,13 +651,39 @@ class BrokerClient(RESTClient):
 
         account_id = validate_uuid_id_param(account_id)
 
-        result = self.get(f"/trading/accounts/{account_id}/account")
+        result = self.get(_trading_account_path(account_id) + "/account")
 
         if self._use_raw_data:
             return result
 
         return TradeAccount(**result)
 
+    def get_trade_accounts_by_ids(
+        self,
+        account_ids: List[Union[UUID, str]],
+        max_workers: int = 16,
+    ) -> List[Union[TradeAccount, RawData]]:
+        """
+        Gets TradeAccount information for many Accounts at once, issuing the requests concurrently.
+
+        Args:
+            account_ids (List[Union[UUID, str]]): The UUID identifiers for the Accounts you wish to get the info for.
+            max_workers (int): The maximum number of requests in flight at once. Defaults to 16.
+
+        Returns:
+            List[alpaca.broker.models.accounts.TradeAccount]: TradeAccount info for each account, in the same order
+              as `account_ids`.
+        """
+        account_ids = [validate_uuid_id_param(account_id) for account_id in account_ids]
+
+        return self.bulk(
+            [
+                partial(self.get_trade_account_by_id, account_id)
+                for account_id in account_ids
+            ],
+            max_workers=max_workers,
+        )
+
     def upload_documents_to_account(
         self,
         account_id: Union[UUID, str],
@@ -465,12 +737,11 @@ class BrokerClient(RESTClient):
 
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        resp = self.get(f"/trading/accounts/{account_id}/account/configurations")
-
-        if self._use_raw_data:
-            return resp
-
-        return TradeAccountConfiguration(**resp)
+        return self._get_validated(
+            _TRADE_ACCOUNT_CONFIGURATION_ADAPTER,
+            _trading_account_path(account_id) + "/account/configurations",
+            use_etag=True,
+        )
 
     def update_trade_configuration_for_account(
         self,
@@ -490,7 +761,7 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
 
         result = self.patch(
-            f"/trading/accounts/{account_id}/account/configurations",
+            _trading_account_path(account_id) + "/account/configurations",
             config.model_dump(),
         )
 
@@ -562,9 +833,7 @@ class BrokerClient(RESTClient):
         iterator = self._get_account_activities_iterator(
             activity_filter=activity_filter,
             max_items_limit=max_items_limit,
-            mapping=lambda raw_activities: [
-                self._parse_activity(activity) for activity in raw_activities
-            ],
+            mapping=BrokerClient._parse_activities,
         )
 
         return BrokerClient._return_paginated_result(iterator, handle_pagination)
@@ -618,25 +887,31 @@ class BrokerClient(RESTClient):
 
             num_items_returned = len(result)
 
-            # need to handle the case where the api won't page and returns all results, ie `date` is set
+            # need to handle the case where the api won't page and returns all results, ie `date` is set.
             if (
                 max_items_limit is not None
                 and num_items_returned + total_items > max_items_limit
             ):
-                result = result[: (max_items_limit - total_items)]
+                del result[max_items_limit - total_items :]
 
                 total_items += max_items_limit - total_items
             else:
                 total_items += num_items_returned
 
-            yield mapping(result)
+            # grab what we need for the next page token up front, so the raw page can be released before handing
+            # the parsed page to the caller instead of keeping both alive while they work through it
+            last_result = result[-1]
+            page = mapping(result)
+            del result
+
+            yield page
+
+            del page
 
             if max_items_limit is not None and total_items >= max_items_limit:
                 break
 
             # ok we made it to the end, we need to ask for the next page of results
-            last_result = result[-1]
-
             if "id" not in last_result:
                 raise APIError(
                     "AccountActivity didn't contain an `id` field to use for paginating results"
@@ -659,15 +934,42 @@ class BrokerClient(RESTClient):
             ValueError: Will raise a ValueError if `data` doesn't contain an `activity_type` field to compare
         """
 
-        if "activity_type" not in data or data["activity_type"] is None:
-            raise ValueError(
-                "Failed parsing raw activity data, `activity_type` is not present in fields"
-            )
+        return BrokerClient._parse_activities([data])[0]
+
+    @staticmethod
+    def _parse_activities(
+        raw_activities: List[dict],
+    ) -> List[Union[TradeActivity, NonTradeActivity]]:
+        """
+        Converts a page of raw activity data into Activity instances, picking the child class for each item with a
+        single set lookup on its `activity_type`.
+
+        Args:
+            raw_activities (List[dict]): the raw activity dicts as returned from the api
+
+        Raises:
+            ValueError: Will raise a ValueError if an item doesn't contain an `activity_type` field to compare
+        """
+        # bind everything used in the loop locally since pages can hold thousands of activities
+        trade_activity_types = _TRADE_ACTIVITY_TYPES
+        validate_trade_activity = _TRADE_ACTIVITY_ADAPTER.validate_python
+        validate_non_trade_activity = _NON_TRADE_ACTIVITY_ADAPTER.validate_python
+        activities = []
 
-        if ActivityType.is_str_trade_activity(data["activity_type"]):
-            return TypeAdapter(TradeActivity).validate_python(data)
-        else:
-            return TypeAdapter(NonTradeActivity).validate_python(data)
+        for data in raw_activities:
+            activity_type = data.get("activity_type")
+
+            if activity_type is None:
+                raise ValueError(
+                    "Failed parsing raw activity data, `activity_type` is not present in fields"
+                )
+
+            if activity_type in trade_activity_types:
+                activities.append(validate_trade_activity(data))
+            else:
+                activities.append(validate_non_trade_activity(data))
+
+        return activities
 
     # ############################## TRADE ACCOUNT DOCUMENTS ################################# #
 
@@ -690,16 +992,12 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id)
 
-        result = self.get(
+        return self._get_validated(
+            _TRADE_DOCUMENT_LIST_ADAPTER,
             f"/accounts/{account_id}/documents",
-            documents_filter.to_request_fields() if documents_filter else {},
+            documents_filter.to_request_fields() if documents_filter else None,
         )
 
-        if self._use_raw_data:
-            return result
-
-        return TypeAdapter(List[TradeDocument]).validate_python(result)
-
     def get_trade_document_for_account_by_id(
         self,
         account_id: Union[UUID, str],
@@ -722,12 +1020,9 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id)
         document_id = validate_uuid_id_param(document_id, "document_id")
 
-        response = self.get(f"/accounts/{account_id}/documents/{document_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(TradeDocument).validate_python(response)
+        return self._get_validated(
+            _TRADE_DOCUMENT_ADAPTER, f"/accounts/{account_id}/documents/{document_id}"
+        )
 
     def download_trade_document_for_account_by_id(
         self,
@@ -754,16 +1049,19 @@ class BrokerClient(RESTClient):
         # self.get/post/etc all set follow redirects to false, however API will return a 301 redirect we need to follow,
         # so we just do a raw request
 
-        # force base_url to be a string value instead of enum name
-        base_url = self._base_url + ""
-
-        target_url = f"{base_url}/{self._api_version}/accounts/{account_id}/documents/{document_id}/download"
+        # the url and headers don't change between retries so only build them once. concatenating (rather than
+        # formatting) base_url gives us its string value instead of the enum name
+        target_url = (
+            self._base_url
+            + f"/{self._api_version}/accounts/{account_id}/documents/{document_id}/download"
+        )
+        headers = self._get_default_headers()
         num_tries = 0
 
         while num_tries <= self._retry:
             response = self._session.get(
                 url=target_url,
-                headers=self._get_default_headers(),
+                headers=headers,
                 allow_redirects=True,
                 stream=True,
             )
@@ -788,11 +1086,12 @@ class BrokerClient(RESTClient):
             # we got here either by error or someone has mis-configured us, so we didn't even try
             raise Exception("Somehow we never made a request for download!")
 
+        # copy straight from the underlying stream in large blocks instead of looping over chunks in python.
+        # decode_content makes sure any gzip/deflate transfer encoding is still undone like iter_content would
+        response.raw.decode_content = True
+
         with open(file_path, "wb") as f:
-            # we specify chunk_size none which is okay since we set stream to true above, so chunks will be as we
-            # receive them from the api
-            for chunk in response.iter_content(chunk_size=None):
-                f.write(chunk)
+            shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
 
     # ############################## FUNDING ################################# #
 
@@ -852,12 +1151,12 @@ class BrokerClient(RESTClient):
         if statuses is not None and len(statuses) != 0:
             params["statuses"] = ",".join(statuses)
 
-        response = self.get(f"/accounts/{account_id}/ach_relationships", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[ACHRelationship]).validate_python(response)
+        return self._get_validated(
+            _ACH_RELATIONSHIP_LIST_ADAPTER,
+            f"/accounts/{account_id}/ach_relationships",
+            params,
+            use_etag=True,
+        )
 
     def delete_ach_relationship_for_account(
         self,
@@ -919,12 +1218,9 @@ class BrokerClient(RESTClient):
             List[Bank]: List of Banks returned by the query.
         """
         account_id = validate_uuid_id_param(account_id)
-        response = self.get(f"/accounts/{account_id}/recipient_banks")
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[Bank]).validate_python(response)
+        return self._get_validated(
+            _BANK_LIST_ADAPTER, f"/accounts/{account_id}/recipient_banks", use_etag=True
+        )
 
     def delete_bank_for_account(
         self,
@@ -1010,6 +1306,41 @@ class BrokerClient(RESTClient):
 
         return BrokerClient._return_paginated_result(iterator, handle_pagination)
 
+    def iterate_transfers_for_account(
+        self,
+        account_id: Union[UUID, str],
+        transfers_filter: Optional[GetTransfersRequest] = None,
+        max_items_limit: Optional[int] = None,
+    ) -> Iterator[Transfer]:
+        """
+        Iterates over the transfers for an account one Transfer at a time.
+
+        Pages are fetched lazily and each Transfer is only validated once the caller gets to it, so walking a long
+        history keeps just the current raw page in memory, and breaking out of the loop early skips validating the
+        rest of the page and requesting the next ones.
+
+        Args:
+            account_id (Union[UUID, str]): The ID of the Account to get the transfers for.
+            transfers_filter (Optional[GetTransferRequest]): The various filtering parameters to apply to the request.
+            max_items_limit (Optional[int]): A maximum number of transfers to yield over all.
+
+        Returns:
+            Iterator[Transfer]: An Iterator of Transfer objects.
+        """
+        account_id = validate_uuid_id_param(account_id)
+
+        for page in self._get_raw_transfer_pages(
+            account_id=account_id,
+            transfers_filter=(
+                transfers_filter
+                if transfers_filter is not None
+                else GetTransfersRequest()
+            ),
+            max_items_limit=max_items_limit,
+        ):
+            for item in page:
+                yield Transfer(**item)
+
     def _get_transfers_iterator(
         self,
         account_id: UUID,
@@ -1019,12 +1350,27 @@ class BrokerClient(RESTClient):
         """
         Private method for handling the iterator parts of get_transfers_for_account.
         """
+        for page in self._get_raw_transfer_pages(
+            account_id, transfers_filter, max_items_limit
+        ):
+            yield _TRANSFER_LIST_ADAPTER.validate_python(page)
+
+    def _get_raw_transfer_pages(
+        self,
+        account_id: UUID,
+        transfers_filter: GetTransfersRequest,
+        max_items_limit: Optional[int],
+    ) -> Iterator[List[RawData]]:
+        """
+        Private method that walks the transfer pages and yields each one as the raw list of dicts the api returned.
+        """
         # We need to track total items retrieved.
         total_items = 0
         request_fields = transfers_filter.to_request_fields()
+        start_offset = transfers_filter.offset or 0
 
         while True:
-            request_fields["offset"] = total_items
+            request_fields["offset"] = start_offset + total_items
             result = self.get(f"/accounts/{account_id}/transfers", request_fields)
 
             # The api returns [] when it's done.
@@ -1037,12 +1383,12 @@ class BrokerClient(RESTClient):
                 max_items_limit is not None
                 and num_items_returned + total_items > max_items_limit
             ):
-                result = result[: (max_items_limit - total_items)]
-                total_items += max_items_limit - total_items
+                del result[max_items_limit - total_items :]
+                total_items = max_items_limit
             else:
                 total_items += num_items_returned
 
-            yield TypeAdapter(List[Transfer]).validate_python(result)
+            yield result
 
             if max_items_limit is not None and total_items >= max_items_limit:
                 break
@@ -1082,11 +1428,9 @@ class BrokerClient(RESTClient):
             List[Position]: List of open positions from the account.
         """
         account_id = validate_uuid_id_param(account_id)
-        response = self.get(f"/trading/accounts/{account_id}/positions")
-
-        if self._use_raw_data:
-            return response
-        return TypeAdapter(List[Position]).validate_python(response)
+        return self._get_validated(
+            _POSITION_LIST_ADAPTER, _trading_account_path(account_id) + "/positions"
+        )
 
     def get_all_accounts_positions(
         self,
@@ -1119,15 +1463,11 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id)
         symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
-        response = self.get(
-            f"/trading/accounts/{account_id}/positions/{symbol_or_asset_id}"
+        return self._get_validated(
+            _POSITION_ADAPTER,
+            _trading_account_path(account_id) + f"/positions/{symbol_or_asset_id}",
         )
 
-        if self._use_raw_data:
-            return response
-
-        return Position(**response)
-
     def close_all_positions_for_account(
         self,
         account_id: Union[UUID, str],
@@ -1148,13 +1488,50 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id)
         response = self.delete(
-            f"/trading/accounts/{account_id}/positions",
+            _trading_account_path(account_id) + "/positions",
             {"cancel_orders": cancel_orders} if cancel_orders else None,
         )
 
         if self._use_raw_data:
             return response
-        return TypeAdapter(List[ClosePositionResponse]).validate_python(response)
+        return _CLOSE_POSITION_RESPONSE_LIST_ADAPTER.validate_python(response)
+
+    def close_all_positions_for_accounts(
+        self,
+        account_ids: List[Union[UUID, str]],
+        cancel_orders: Optional[bool] = None,
+        max_workers: int = 16,
+    ) -> Dict[UUID, Union[List[ClosePositionResponse], RawData, Exception]]:
+        """
+        Liquidates all positions for many accounts at once, issuing the requests concurrently.
+
+        Args:
+            account_ids (List[Union[UUID, str]]): The IDs of the Accounts to close the positions for. An ID given more
+              than once is only requested once.
+            cancel_orders (Optional[bool]): If true is specified, cancel all open orders before liquidating all positions.
+            max_workers (int): The maximum number of requests in flight at once. Defaults to 16.
+
+        Returns:
+            Dict[UUID, Union[List[ClosePositionResponse], Exception]]: The responses from each closed position, keyed
+              by account ID. An account whose request failed maps to the exception raised for it instead, so the
+              accounts that were liquidated are still reported.
+        """
+        account_ids = list(
+            dict.fromkeys(
+                validate_uuid_id_param(account_id) for account_id in account_ids
+            )
+        )
+
+        results = self.bulk(
+            [
+                partial(self.close_all_positions_for_account, account_id, cancel_orders)
+                for account_id in account_ids
+            ],
+            max_workers=max_workers,
+            return_exceptions=True,
+        )
+
+        return dict(zip(account_ids, results))
 
     def close_position_for_account(
         self,
@@ -1178,8 +1555,8 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id)
         symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
         response = self.delete(
-            f"/trading/accounts/{account_id}/positions/{symbol_or_asset_id}",
-            close_options.to_request_fields() if close_options else {},
+            _trading_account_path(account_id) + f"/positions/{symbol_or_asset_id}",
+            close_options.to_request_fields() if close_options else None,
         )
 
         if self._use_raw_data:
@@ -1205,8 +1582,8 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id)
 
         response = self.get(
-            f"/trading/accounts/{account_id}/account/portfolio/history",
-            history_filter.to_request_fields() if history_filter else {},
+            _trading_account_path(account_id) + "/account/portfolio/history",
+            history_filter.to_request_fields() if history_filter else None,
         )
 
         if self._use_raw_data:
@@ -1225,16 +1602,12 @@ class BrokerClient(RESTClient):
             Clock: The market Clock data
         """
 
-        response = self.get("/clock")
-
-        if self._use_raw_data:
-            return response
-
-        return Clock(**response)
+        return self._get_validated(_CLOCK_ADAPTER, "/clock")
 
     def get_calendar(
         self,
         filters: Optional[GetCalendarRequest] = None,
+        use_cache: bool = True,
     ) -> Union[List[Calendar], RawData]:
         """
         The calendar API serves the full list of market days from 1970 to 2029. It can also be queried by specifying a
@@ -1243,22 +1616,28 @@ class BrokerClient(RESTClient):
         In addition to the dates, the response also contains the specific open and close times for the market days,
         taking into account early closures.
 
+        The calendar rarely changes, so the response for each set of filters is cached on the client for a day and
+        revalidated with its ETag afterwards. An early closure announced within that day won't show up until the
+        cached response expires unless `use_cache` is False, or the client was created with
+        `use_response_cache=False`.
+
         Args:
             filters: Any optional filters to limit the returned market days
+            use_cache (bool): Whether a cached response may be returned. If False the calendar is always fetched from
+              the api. Defaults to True.
 
         Returns:
             List[Calendar]: A list of Calendar objects representing the market days.
         """
 
-        result = self.get(
-            "/calendar", filters.to_request_fields() if filters is not None else {}
+        return self._get_validated(
+            _CALENDAR_LIST_ADAPTER,
+            "/calendar",
+            filters.to_request_fields() if filters is not None else None,
+            use_etag=use_cache,
+            cache_ttl=CALENDAR_CACHE_TTL_SECONDS if use_cache else None,
         )
 
-        if self._use_raw_data:
-            return result
-
-        return TypeAdapter(List[Calendar]).validate_python(result)
-
     # ############################## WATCHLISTS ################################# #
 
     def get_watchlists_for_account(
@@ -1276,12 +1655,11 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        result = self.get(f"/trading/accounts/{account_id}/watchlists")
-
-        if self._use_raw_data:
-            return result
-
-        return TypeAdapter(List[Watchlist]).validate_python(result)
+        return self._get_validated(
+            _WATCHLIST_LIST_ADAPTER,
+            _trading_account_path(account_id) + "/watchlists",
+            use_etag=True,
+        )
 
     def get_watchlist_for_account_by_id(
         self,
@@ -1301,7 +1679,9 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
         watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
 
-        result = self.get(f"/trading/accounts/{account_id}/watchlists/{watchlist_id}")
+        result = self.get(
+            _trading_account_path(account_id) + f"/watchlists/{watchlist_id}"
+        )
 
         if self._use_raw_data:
             return result
@@ -1326,7 +1706,7 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
 
         result = self.post(
-            f"/trading/accounts/{account_id}/watchlists",
+            _trading_account_path(account_id) + "/watchlists",
             watchlist_data.to_request_fields(),
         )
 
@@ -1358,7 +1738,7 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
 
         result = self.put(
-            f"/trading/accounts/{account_id}/watchlists/{watchlist_id}",
+            _trading_account_path(account_id) + f"/watchlists/{watchlist_id}",
             watchlist_data.to_request_fields(),
         )
 
@@ -1389,7 +1769,7 @@ class BrokerClient(RESTClient):
         params = {"symbol": symbol}
 
         result = self.post(
-            f"/trading/accounts/{account_id}/watchlists/{watchlist_id}", params
+            _trading_account_path(account_id) + f"/watchlists/{watchlist_id}", params
         )
 
         if self._use_raw_data:
@@ -1415,7 +1795,7 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
         watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
 
-        self.delete(f"/trading/accounts/{account_id}/watchlists/{watchlist_id}")
+        self.delete(_trading_account_path(account_id) + f"/watchlists/{watchlist_id}")
 
     def remove_asset_from_watchlist_for_account_by_id(
         self,
@@ -1438,7 +1818,7 @@ class BrokerClient(RESTClient):
         watchlist_id = validate_uuid_id_param(watchlist_id, "watchlist_id")
 
         result = self.delete(
-            f"/trading/accounts/{account_id}/watchlists/{watchlist_id}/{symbol}"
+            _trading_account_path(account_id) + f"/watchlists/{watchlist_id}/{symbol}"
         )
 
         if self._use_raw_data:
@@ -1494,7 +1874,7 @@ class BrokerClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[BatchJournalResponse]).validate_python(response)
+        return _BATCH_JOURNAL_RESPONSE_LIST_ADAPTER.validate_python(response)
 
     def create_reverse_batch_journal(
         self,
@@ -1518,7 +1898,7 @@ class BrokerClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[BatchJournalResponse]).validate_python(response)
+        return _BATCH_JOURNAL_RESPONSE_LIST_ADAPTER.validate_python(response)
 
     def get_journals(
         self, journal_filter: Optional[GetJournalsRequest] = None
@@ -1532,14 +1912,9 @@ class BrokerClient(RESTClient):
         Returns:
             List[Journal]: The journals from the query.
         """
-        params = journal_filter.to_request_fields() if journal_filter else {}
+        params = journal_filter.to_request_fields() if journal_filter else None
 
-        response = self.get("/journals", params)
-
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(List[Journal]).validate_python(response)
+        return self._get_validated(_JOURNAL_LIST_ADAPTER, "/journals", params)
 
     def get_journal_by_id(
         self, journal_id: Union[UUID, str] = None
@@ -1595,16 +1970,11 @@ class BrokerClient(RESTClient):
             List[Asset]: The list of assets.
         """
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
-
-        response = self.get(f"/assets", params)
-
-        if self._use_raw_data:
-            return response
+        params = filter.to_request_fields() if filter is not None else None
 
-        return TypeAdapter(
-            List[Asset],
-        ).validate_python(response)
+        return self._get_validated(
+            _ASSET_LIST_ADAPTER, f"/assets", params, use_etag=True
+        )
 
     def get_asset(self, symbol_or_asset_id: Union[UUID, str]) -> Union[Asset, RawData]:
         """
@@ -1620,12 +1990,7 @@ class BrokerClient(RESTClient):
 
         symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
 
-        response = self.get(f"/assets/{symbol_or_asset_id}")
-
-        if self._use_raw_data:
-            return response
-
-        return Asset(**response)
+        return self._get_validated(_ASSET_ADAPTER, f"/assets/{symbol_or_asset_id}")
 
     # ############################## ORDERS ################################# #
 
@@ -1646,7 +2011,7 @@ class BrokerClient(RESTClient):
 
         data = order_data.to_request_fields()
 
-        response = self.post(f"/trading/accounts/{account_id}/orders", data)
+        response = self.post(_trading_account_path(account_id) + "/orders", data)
 
         if self._use_raw_data:
             return response
@@ -1669,19 +2034,11 @@ class BrokerClient(RESTClient):
         account_id = validate_uuid_id_param(account_id, "account_id")
 
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
-
-        if "symbols" in params and isinstance(params["symbols"], list):
-            params["symbols"] = ",".join(params["symbols"])
-
-        response = self.get(f"/trading/accounts/{account_id}/orders", params)
-
-        if self._use_raw_data:
-            return response
+        params = filter.to_request_fields() if filter is not None else None
 
-        return TypeAdapter(
-            List[Order],
-        ).validate_python(response)
+        return self._get_validated(
+            _ORDER_LIST_ADAPTER, _trading_account_path(account_id) + "/orders", params
+        )
 
     def get_order_for_account_by_id(
         self,
@@ -1704,14 +2061,13 @@ class BrokerClient(RESTClient):
         order_id = validate_uuid_id_param(order_id, "order_id")
 
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
-
-        response = self.get(f"/trading/accounts/{account_id}/orders/{order_id}", params)
+        params = filter.to_request_fields() if filter is not None else None
 
-        if self._use_raw_data:
-            return response
-
-        return Order(**response)
+        return self._get_validated(
+            _ORDER_ADAPTER,
+            _trading_account_path(account_id) + f"/orders/{order_id}",
+            params,
+        )
 
     def get_order_for_account_by_client_id(
         self, account_id: Union[UUID, str], client_id: str
@@ -1731,7 +2087,7 @@ class BrokerClient(RESTClient):
         params = {"client_order_id": client_id}
 
         response = self.get(
-            f"/trading/accounts/{account_id}/orders:by_client_order_id", params
+            _trading_account_path(account_id) + "/orders:by_client_order_id", params
         )
 
         if self._use_raw_data:
@@ -1763,7 +2119,7 @@ class BrokerClient(RESTClient):
         params = order_data.to_request_fields() if order_data is not None else {}
 
         response = self.patch(
-            f"/trading/accounts/{account_id}/orders/{order_id}", params
+            _trading_account_path(account_id) + f"/orders/{order_id}", params
         )
 
         if self._use_raw_data:
@@ -1785,14 +2141,47 @@ class BrokerClient(RESTClient):
         """
         account_id = validate_uuid_id_param(account_id, "account_id")
 
-        response = self.delete(f"/trading/accounts/{account_id}/orders")
+        response = self.delete(_trading_account_path(account_id) + "/orders")
 
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(
-            List[CancelOrderResponse],
-        ).validate_python(response)
+        return _CANCEL_ORDER_RESPONSE_LIST_ADAPTER.validate_python(response)
+
+    def cancel_orders_for_accounts(
+        self,
+        account_ids: List[Union[UUID, str]],
+        max_workers: int = 16,
+    ) -> Dict[UUID, Union[List[CancelOrderResponse], RawData, Exception]]:
+        """
+        Cancels all orders for many accounts at once, issuing the requests concurrently.
+
+        Args:
+            account_ids (List[Union[UUID, str]]): The accounts to cancel the orders for. An ID given more than once
+              is only requested once.
+            max_workers (int): The maximum number of requests in flight at once. Defaults to 16.
+
+        Returns:
+            Dict[UUID, Union[List[CancelOrderResponse], Exception]]: The HTTP statuses for each order attempted to be
+              cancelled, keyed by account ID. An account whose request failed maps to the exception raised for it
+              instead, so the accounts that were cancelled are still reported.
+        """
+        account_ids = list(
+            dict.fromkeys(
+                validate_uuid_id_param(account_id) for account_id in account_ids
+            )
+        )
+
+        results = self.bulk(
+            [
+                partial(self.cancel_orders_for_account, account_id)
+                for account_id in account_ids
+            ],
+            max_workers=max_workers,
+            return_exceptions=True,
+        )
+
+        return dict(zip(account_ids, results))
 
     def cancel_order_for_account_by_id(
         self, account_id: Union[UUID, str], order_id: Union[UUID, str]
@@ -1810,7 +2199,7 @@ class BrokerClient(RESTClient):
 
         # TODO: Should ideally return some information about the order's cancel status (Issue #78)
         # TODO: Currently no way to retrieve status details for empty responses with base REST implementation
-        self.delete(f"/trading/accounts/{account_id}/orders/{order_id}")
+        self.delete(_trading_account_path(account_id) + f"/orders/{order_id}")
 
     # ############################## CORPORATE ACTIONS ################################# #
 
@@ -1824,19 +2213,14 @@ class BrokerClient(RESTClient):
         Returns:
             List[CorporateActionAnnouncement]: The resulting announcements from the search.
         """
-        params = filter.to_request_fields() if filter else {}
-
-        if "ca_types" in params and isinstance(params["ca_types"], list):
-            params["ca_types"] = ",".join(params["ca_types"])
+        params = filter.to_request_fields() if filter else None
 
         response = self.get("/corporate_actions/announcements", params)
 
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(
-            List[CorporateActionAnnouncement],
-        ).validate_python(response)
+        return _CORPORATE_ACTION_ANNOUNCEMENT_LIST_ADAPTER.validate_python(response)
 
     def get_corporate_announcement_by_id(
         self, corporate_announcment_id: Union[UUID, str]
@@ -1875,25 +2259,7 @@ class BrokerClient(RESTClient):
         Returns:
             Iterator: Yields events as they arrive
         """
-
-        params = {}
-
-        if filter:
-            params = filter.to_request_fields()
-
-        url = self._base_url + "/" + self._api_version + "/events/accounts/status"
-
-        response = self._session.get(
-            url=url,
-            params=params,
-            stream=True,
-            headers=self._get_sse_headers(),
-        )
-
-        client = sseclient.SSEClient(response)
-
-        for event in client.events():
-            yield event.data
+        return self._subscribe_to_events("/accounts/status", filter)
 
     def get_trade_events(self, filter: Optional[GetEventsRequest] = None) -> Iterator:
         """
@@ -1905,24 +2271,7 @@ class BrokerClient(RESTClient):
         Returns:
             Iterator: Yields events as they arrive
         """
-        params = {}
-
-        if filter:
-            params = filter.to_request_fields()
-
-        url = self._base_url + "/" + self._api_version + "/events/trades"
-
-        response = self._session.get(
-            url=url,
-            params=params,
-            stream=True,
-            headers=self._get_sse_headers(),
-        )
-
-        client = sseclient.SSEClient(response)
-
-        for event in client.events():
-            yield event.data
+        return self._subscribe_to_events("/trades", filter)
 
     def get_journal_events(self, filter: Optional[GetEventsRequest] = None) -> Iterator:
         """
@@ -1934,24 +2283,7 @@ class BrokerClient(RESTClient):
         Returns:
             Iterator: Yields events as they arrive
         """
-        params = {}
-
-        if filter:
-            params = filter.to_request_fields()
-
-        url = self._base_url + "/" + self._api_version + "/events/journals/status"
-
-        response = self._session.get(
-            url=url,
-            params=params,
-            stream=True,
-            headers=self._get_sse_headers(),
-        )
-
-        client = sseclient.SSEClient(response)
-
-        for event in client.events():
-            yield event.data
+        return self._subscribe_to_events("/journals/status", filter)
 
     def get_transfer_events(
         self, filter: Optional[GetEventsRequest] = None
@@ -1965,24 +2297,7 @@ class BrokerClient(RESTClient):
         Returns:
             Iterator: Yields events as they arrive
         """
-        params = {}
-
-        if filter:
-            params = filter.to_request_fields()
-
-        url = self._base_url + "/" + self._api_version + "/events/transfers/status"
-
-        response = self._session.get(
-            url=url,
-            params=params,
-            stream=True,
-            headers=self._get_sse_headers(),
-        )
-
-        client = sseclient.SSEClient(response)
-
-        for event in client.events():
-            yield event.data
+        return self._subscribe_to_events("/transfers/status", filter)
 
     def get_non_trading_activity_events(
         self, filter: Optional[GetEventsRequest] = None
@@ -1996,32 +2311,34 @@ class BrokerClient(RESTClient):
         Returns:
             Iterator: Yields events as they arrive
         """
-        params = {}
+        return self._subscribe_to_events("/nta", filter)
 
-        if filter:
-            params = filter.to_request_fields()
+    def _subscribe_to_events(
+        self, path: str, filter: Optional[GetEventsRequest] = None
+    ) -> Iterator:
+        """
+        Private method shared by the get_*_events methods for subscribing to one of the SSE event streams.
+        """
+        yield from _iter_sse_events(self._open_event_stream(path, filter))
 
-        url = self._base_url + "/" + self._api_version + "/events/nta"
+    def _open_event_stream(
+        self, path: str, filter: Optional[GetEventsRequest] = None
+    ) -> Response:
+        """
+        Sends the request subscribing to one of the SSE event streams and returns the streamed response.
+        """
+        params = filter.to_request_fields() if filter else None
 
-        response = self._session.get(
-            url=url,
+        return self._session.get(
+            url=self._events_url + path,
             params=params,
             stream=True,
             headers=self._get_sse_headers(),
         )
 
-        client = sseclient.SSEClient(response)
-
-        for event in client.events():
-            yield event.data
-
     def _get_sse_headers(self) -> dict:
         headers = self._get_default_headers()
-
-        headers["Connection"] = "keep-alive"
-        headers["Cache-Control"] = "no-cache"
-        headers["Content-Type"] = "text/event-stream"
-        headers["Accept"] = "text/event-stream"
+        headers.update(_SSE_HEADERS)
 
         return headers
 
@@ -2067,17 +2384,12 @@ class BrokerClient(RESTClient):
             List[Portfolio]: List of portfolios.
         """
 
-        response = self.get(
-            "/rebalancing/portfolios", filter.to_request_fields() if filter else {}
+        return self._get_validated(
+            _PORTFOLIO_LIST_ADAPTER,
+            "/rebalancing/portfolios",
+            filter.to_request_fields() if filter else None,
         )
 
-        if self._use_raw_data:
-            return response
-
-        return TypeAdapter(
-            List[Portfolio],
-        ).validate_python(response)
-
     def get_portfolio_by_id(
         self, portfolio_id: Union[UUID, str]
     ) -> Union[Portfolio, RawData]:
@@ -2355,6 +2667,243 @@ class BrokerClient(RESTClient):
 
         params = req.to_request_fields()
         self.post(
-            f"/trading/accounts/{account_id}/positions/{symbol_or_contract_id}/exercise",
+            _trading_account_path(account_id)
+            + f"/positions/{symbol_or_contract_id}/exercise",
             params,
         )
+
+    # ############################## ASYNC ################################# #
+
+    async def _run_async(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Internal method to run one of the blocking client methods in the event loop's default executor so that calls
+        for many accounts can be awaited concurrently with `asyncio.gather`.
+        """
+        loop = asyncio.get_running_loop()
+
+        return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+    async def list_accounts_async(
+        self,
+        search_parameters: Optional[ListAccountsRequest] = None,
+    ) -> Union[List[Account], RawData]:
+        """
+        Awaitable version of `list_accounts`.
+
+        Args:
+            search_parameters (Optional[ListAccountsRequest]): The various filtering criteria you can specify.
+
+        Returns:
+            List[Account]: The filtered list of Accounts
+        """
+        return await self._run_async(self.list_accounts, search_parameters)
+
+    async def get_account_activities_async(
+        self,
+        activity_filter: GetAccountActivitiesRequest,
+        max_items_limit: Optional[int] = None,
+    ) -> List[BaseActivity]:
+        """
+        Awaitable version of `get_account_activities`. Pages for a single filter are still fetched one after another
+        since each page token comes from the previous page, but filters for different accounts can be gathered
+        concurrently.
+
+        Args:
+            activity_filter (GetAccountActivitiesRequest): The various filtering fields you can specify to restrict
+              results
+            max_items_limit (Optional[int]): A maximum number of items to return over all.
+
+        Returns:
+            List[BaseActivity]: A list of BaseActivity child classes
+        """
+        return await self._run_async(
+            self.get_account_activities,
+            activity_filter,
+            max_items_limit,
+            PaginationType.FULL,
+        )
+
+    async def get_trade_documents_for_account_async(
+        self,
+        account_id: Union[UUID, str],
+        documents_filter: Optional[GetTradeDocumentsRequest] = None,
+    ) -> Union[List[TradeDocument], RawData]:
+        """
+        Awaitable version of `get_trade_documents_for_account`.
+
+        Args:
+            account_id (Union[UUID, str]): The id of the Account you wish to retrieve documents for.
+            documents_filter (Optional[GetTradeDocumentsRequest]): The optional set of filters you can apply to filter
+              the returned list.
+
+        Returns:
+            List[TradeDocument]: The filtered list of TradeDocuments
+        """
+        return await self._run_async(
+            self.get_trade_documents_for_account, account_id, documents_filter
+        )
+
+    async def get_ach_relationships_for_account_async(
+        self,
+        account_id: Union[UUID, str],
+        statuses: Optional[List[ACHRelationshipStatus]] = None,
+    ) -> Union[List[ACHRelationship], RawData]:
+        """
+        Awaitable version of `get_ach_relationships_for_account`.
+
+        Args:
+            account_id (Union[UUID, str]): The ID of the Account to get the ACH relationships for.
+            statuses (Optional[List[ACHRelationshipStatus]]): Optionally filter a subset of ACH relationship statuses.
+
+        Returns:
+            List[ACHRelationship]: List of ACH relationships returned by the query.
+        """
+        return await self._run_async(
+            self.get_ach_relationships_for_account, account_id, statuses
+        )
+
+    async def get_banks_for_account_async(
+        self,
+        account_id: Union[UUID, str],
+    ) -> Union[List[Bank], RawData]:
+        """
+        Awaitable version of `get_banks_for_account`.
+
+        Args:
+            account_id (Union[UUID, str]): The ID of the Account to get the Banks for.
+
+        Returns:
+            List[Bank]: List of Banks returned by the query.
+        """
+        return await self._run_async(self.get_banks_for_account, account_id)
+
+    async def get_transfers_for_account_async(
+        self,
+        account_id: Union[UUID, str],
+        transfers_filter: Optional[GetTransfersRequest] = None,
+        max_items_limit: Optional[int] = None,
+    ) -> List[Transfer]:
+        """
+        Awaitable version of `get_transfers_for_account` with `PaginationType.FULL`. Each page's offset depends on
+        how many transfers the previous pages actually returned, so pages for a single account are still fetched one
+        after another, but the transfers of different accounts can be gathered concurrently.
+
+        Args:
+            account_id (Union[UUID, str]): The ID of the Account to get the transfers for.
+            transfers_filter (Optional[GetTransferRequest]): The various filtering parameters to apply to the request.
+            max_items_limit (Optional[int]): A maximum number of items to return over all.
+
+        Returns:
+            List[Transfer]: The list of Transfers.
+        """
+        return await self._run_async(
+            self.get_transfers_for_account,
+            account_id,
+            transfers_filter,
+            max_items_limit,
+            PaginationType.FULL,
+        )
+
+    async def _subscribe_to_events_async(
+        self, path: str, filter: Optional[GetEventsRequest] = None
+    ) -> AsyncIterator[str]:
+        """
+        Private method shared by the get_*_events_async methods so that several event streams can be consumed from one
+        event loop.
+
+        A stream spends most of its time blocked on a read, so each one gets a thread of its own rather than holding on
+        to one of the default executor's threads that _run_async shares with every other *_async method.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1)
+        opening = executor.submit(self._open_event_stream, path, filter)
+
+        try:
+            response = await asyncio.wrap_future(opening)
+            events = _iter_sse_events(response)
+
+            while True:
+                event = await loop.run_in_executor(executor, next, events, None)
+
+                if event is None:
+                    return
+
+                yield event
+        finally:
+            # when the consumer stops early, or is cancelled, a read may still be blocked on the stream's thread.
+            # shutting the socket down wakes it, and the close is queued behind it on the same thread.
+            if opening.done() and not opening.cancelled() and not opening.exception():
+                _interrupt_stream(opening.result())
+
+            executor.submit(_close_opened_stream, opening)
+            executor.shutdown(wait=False)
+
+    def get_account_status_events_async(
+        self, filter: Optional[GetEventsRequest] = None
+    ) -> AsyncIterator[str]:
+        """
+        Async iterator version of `get_account_status_events`.
+
+        Args:
+            filter (Optional[GetEventsRequest]): The arguments for filtering the events.
+
+        Returns:
+            AsyncIterator[str]: Yields events as they arrive
+        """
+        return self._subscribe_to_events_async("/accounts/status", filter)
+
+    def get_trade_events_async(
+        self, filter: Optional[GetEventsRequest] = None
+    ) -> AsyncIterator[str]:
+        """
+        Async iterator version of `get_trade_events`.
+
+        Args:
+            filter (Optional[GetEventsRequest]): The arguments for filtering the events.
+
+        Returns:
+            AsyncIterator[str]: Yields events as they arrive
+        """
+        return self._subscribe_to_events_async("/trades", filter)
+
+    def get_journal_events_async(
+        self, filter: Optional[GetEventsRequest] = None
+    ) -> AsyncIterator[str]:
+        """
+        Async iterator version of `get_journal_events`.
+
+        Args:
+            filter (Optional[GetEventsRequest]): The arguments for filtering the events.
+
+        Returns:
+            AsyncIterator[str]: Yields events as they arrive
+        """
+        return self._subscribe_to_events_async("/journals/status", filter)
+
+    def get_transfer_events_async(
+        self, filter: Optional[GetEventsRequest] = None
+    ) -> AsyncIterator[str]:
+        """
+        Async iterator version of `get_transfer_events`.
+
+        Args:
+            filter (Optional[GetEventsRequest]): The arguments for filtering the events.
+
+        Returns:
+            AsyncIterator[str]: Yields events as they arrive
+        """
+        return self._subscribe_to_events_async("/transfers/status", filter)
+
+    def get_non_trading_activity_events_async(
+        self, filter: Optional[GetEventsRequest] = None
+    ) -> AsyncIterator[str]:
+        """
+        Async iterator version of `get_non_trading_activity_events`.
+
+        Args:
+            filter (Optional[GetEventsRequest]): The arguments for filtering the events.
+
+        Returns:
+            AsyncIterator[str]: Yields events as they arrive
+        """
+        return self._subscribe_to_events_async("/nta", filter)
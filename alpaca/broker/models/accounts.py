@@ -1,8 +1,7 @@
 from datetime import datetime
 from typing import Any, Dict, List, Optional
-from uuid import UUID
 
-from pydantic import TypeAdapter, ValidationInfo, field_validator, model_validator
+from pydantic import model_validator
 
 from alpaca.broker.enums import (
     AgreementType,
@@ -64,25 +63,6 @@ class Contact(BaseModel):
     postal_code: Optional[str] = None
     country: Optional[str] = None
 
-    @field_validator("state")
-    def usa_state_has_value(cls, v: str, validation: ValidationInfo, **kwargs) -> str:
-        """Validates that the state has a value if the country is USA
-
-        Args:
-            v (str): The state field's value
-            values (dict): The values of each field
-
-        Raises:
-            ValueError: State is required for country USA
-
-        Returns:
-            str: The value of the state field
-        """
-        values: dict = validation.data
-        if "country" in values and values["country"] == "USA" and v is None:
-            raise ValueError("State is required for country USA.")
-        return v
-
 
 class Identity(BaseModel):
     """User identity details within Account Model
@@ -204,20 +184,14 @@ class TrustedContact(BaseModel):
     postal_code: Optional[str] = None
     country: Optional[str] = None
 
-    @model_validator(mode="before")
-    def root_validator(cls, values: dict) -> dict:
-        has_phone_number = (
-            "phone_number" in values and values["phone_number"] is not None
-        )
-        has_street_address = (
-            "street_address" in values and values["street_address"] is not None
-        )
-        has_email_address = (
-            "email_address" in values and values["email_address"] is not None
-        )
-
-        if has_phone_number or has_street_address or has_email_address:
-            return values
+    @model_validator(mode="after")
+    def root_validator(self) -> "TrustedContact":
+        if (
+            self.phone_number is not None
+            or self.street_address is not None
+            or self.email_address is not None
+        ):
+            return self
 
         raise ValueError("At least one method of contact required for trusted contact")
 
@@ -262,56 +236,6 @@ class Account(ModelWithID):
     documents: Optional[List[AccountDocument]] = None
     trusted_contact: Optional[TrustedContact] = None
 
-    def __init__(self, **response):
-        super().__init__(
-            id=(UUID(response["id"])),
-            account_number=(response["account_number"]),
-            status=(response["status"]),
-            crypto_status=(
-                response["crypto_status"] if "crypto_status" in response else None
-            ),
-            kyc_results=(
-                TypeAdapter(KycResults).validate_python(response["kyc_results"])
-                if "kyc_results" in response and response["kyc_results"] is not None
-                else None
-            ),
-            currency=(response["currency"]),
-            last_equity=(response["last_equity"]),
-            created_at=(response["created_at"]),
-            contact=(
-                TypeAdapter(Contact).validate_python(response["contact"])
-                if "contact" in response
-                else None
-            ),
-            identity=(
-                TypeAdapter(Identity).validate_python(response["identity"])
-                if "identity" in response
-                else None
-            ),
-            disclosures=(
-                TypeAdapter(Disclosures).validate_python(response["disclosures"])
-                if "disclosures" in response
-                else None
-            ),
-            agreements=(
-                TypeAdapter(List[Agreement]).validate_python(response["agreements"])
-                if "agreements" in response
-                else None
-            ),
-            documents=(
-                TypeAdapter(List[AccountDocument]).validate_python(
-                    response["documents"]
-                )
-                if "documents" in response
-                else None
-            ),
-            trusted_contact=(
-                TypeAdapter(TrustedContact).validate_python(response["trusted_contact"])
-                if "trusted_contact" in response
-                else None
-            ),
-        )
-
 
 class TradeAccount(BaseTradeAccount):
     """
@@ -4,7 +4,7 @@ from ipaddress import IPv4Address, IPv6Address
 from typing import Any, Optional, Union
 from uuid import UUID
 
-from pydantic import model_validator
+from pydantic import field_validator, model_validator
 
 from alpaca.broker.enums import DocumentType, TradeDocumentSubType, TradeDocumentType
 from alpaca.common.models import ModelWithID
@@ -37,14 +37,6 @@ class AccountDocument(BaseModel):
     content: Optional[str] = None
     mime_type: Optional[str] = None
 
-    def __init__(self, **data: Any) -> None:
-        # validate the incoming id field for uuid
-        _id = data.get("id", None)
-        if isinstance(_id, str):
-            data["id"] = UUID(_id)
-
-        super().__init__(**data)
-
 
 class TradeDocument(ModelWithID):
     """
@@ -67,14 +59,10 @@ class TradeDocument(ModelWithID):
     sub_type: Optional[TradeDocumentSubType] = None
     date: datetime_date
 
-    def __init__(self, **data: Any) -> None:
-        if "id" in data and isinstance(data["id"], str):
-            data["id"] = UUID(data["id"])
-
-        if "sub_type" in data and data["sub_type"] == "":
-            data["sub_type"] = None
-
-        super().__init__(**data)
+    @field_validator("sub_type", mode="before")
+    def empty_sub_type_to_none(cls, value: Any) -> Any:
+        """The API returns "" for documents without a sub type, which isn't a TradeDocumentSubType."""
+        return None if value == "" else value
 
 
 class W8BenDocument(BaseModel):
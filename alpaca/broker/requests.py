@@ -154,6 +154,16 @@ class CreateAccountRequest(NonEmptyRequest):
                 raise ValueError(f"{field} is required to create a new account.")
         return values
 
+    @model_validator(mode="after")
+    def usa_contact_has_state(self) -> "CreateAccountRequest":
+        """
+        Validates that the contact's state has a value if their country is USA. Like the fields above it is only
+        required when creating an account, responses and partial updates may leave it out.
+        """
+        if self.contact.country == "USA" and self.contact.state is None:
+            raise ValueError("State is required for country USA.")
+        return self
+
 
 class UpdatableContact(Contact):
     """
@@ -316,15 +326,23 @@ class ListAccountsRequest(NonEmptyRequest):
     created_before: Optional[datetime] = None
     created_after: Optional[datetime] = None
     status: Optional[List[AccountStatus]] = None
-    sort: Sort
+    # The api itself actually defaults to DESC, but this way our docs won't be incorrect if the api changes under us
+    sort: Sort = Sort.DESC
     entities: Optional[List[AccountEntities]] = None
 
-    def __init__(self, *args, **kwargs):
-        # The api itself actually defaults to DESC, but this way our docs won't be incorrect if the api changes under us
-        if "sort" not in kwargs or kwargs["sort"] is None:
-            kwargs["sort"] = Sort.DESC
+    @field_validator("sort", mode="before")
+    def none_sort_to_default(cls, value: Any) -> Any:
+        """Keeps treating an explicit sort=None as the default"""
+        return Sort.DESC if value is None else value
 
-        super().__init__(*args, **kwargs)
+    def to_request_fields(self) -> dict:
+        params = super().to_request_fields()
+
+        # API expects comma separated for entities not multiple params
+        if "entities" in params:
+            params["entities"] = ",".join(entity.value for entity in self.entities)
+
+        return params
 
 
 class GetAccountActivitiesRequest(NonEmptyRequest):
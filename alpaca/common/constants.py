@@ -11,3 +11,15 @@ PageItem = TypeVar("PageItem")  # Generic type for an item from a paginated requ
 DEFAULT_RETRY_ATTEMPTS = 3
 DEFAULT_RETRY_WAIT_SECONDS = 3
 DEFAULT_RETRY_EXCEPTION_CODES = [429, 504]
+
+# connection pool sizing for the requests session http adapter
+DEFAULT_POOL_CONNECTIONS = 32
+DEFAULT_POOL_MAXSIZE = 64
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # bytes copied per read when streaming file downloads
+
+# max number of responses kept around for conditional or cached GETs
+RESPONSE_CACHE_MAX_ENTRIES = 256
+
+# the market calendar only changes when holidays get announced
+CALENDAR_CACHE_TTL_SECONDS = 24 * 60 * 60
@@ -3,10 +3,13 @@ from pydantic import BaseModel
 import pprint
 
 
-class ValidateBaseModel(BaseModel, validate_assignment=True):
+class ValidateBaseModel(BaseModel, validate_assignment=True, defer_build=True):
     """
     This model simply sets up BaseModel with the validate_assignment flag to True, so we don't have to keep specifying
     it or forget to specify it in our models where we want assignment validation
+
+    Building the validators is also deferred until a model is first used, so importing the SDK doesn't pay for the
+    many request and response models a given program never touches.
     """
 
     def __repr__(self):
@@ -26,55 +26,58 @@ class NonEmptyRequest(BaseModel):
             dict: a dict containing any set fields
         """
 
-        def map_values(val: Any) -> Any:
-            """
-            Some types have issues being json encoded, we convert them here to be encodable
+        d = self.model_dump(exclude_none=True)
+        if "symbol_or_symbols" in d:
+            s = d["symbol_or_symbols"]
+            if isinstance(s, list):
+                s = ",".join(s)
+            d["symbols"] = s
+            del d["symbol_or_symbols"]
+
+        # pydantic almost has what we need by passing exclude_none to dict() but it returns:
+        #  {trusted_contact: {}, contact: {}, identity: None, etc}
+        # so we do a simple dict comprehension to filter out None and {}
+        return {key: _map_request_value(val) for key, val in d.items() if val}
+
 
-            also handles nested models and lists
-            """
+def _map_request_value(val: Any) -> Any:
+    """
+    Some types have issues being json encoded, we convert them here to be encodable
 
-            if isinstance(val, UUID):
-                return str(val)
+    also handles nested models and lists
+    """
 
-            if isinstance(val, NonEmptyRequest):
-                return val.to_request_fields()
+    # most request values are plain strings, numbers or str enums which are sent as is
+    if isinstance(val, (str, int, float)):
+        return val
 
-            if isinstance(val, dict):
-                return {k: map_values(v) for k, v in val.items()}
+    if isinstance(val, UUID):
+        return str(val)
 
-            if isinstance(val, list):
-                return [map_values(v) for v in val]
+    if isinstance(val, NonEmptyRequest):
+        return val.to_request_fields()
 
-            # RFC 3339
-            if isinstance(val, datetime):
-                # if the datetime is naive, assume it's UTC
-                # https://docs.python.org/3/library/datetime.html#determining-if-an-object-is-aware-or-naive
-                if val.tzinfo is None or val.tzinfo.utcoffset(val) is None:
-                    val = val.replace(tzinfo=timezone.utc)
-                return val.isoformat()
+    if isinstance(val, dict):
+        return {k: _map_request_value(v) for k, v in val.items()}
 
-            if isinstance(val, date):
-                return val.isoformat()
+    if isinstance(val, list):
+        return [_map_request_value(v) for v in val]
 
-            if isinstance(val, IPv4Address):
-                return str(val)
+    # RFC 3339
+    if isinstance(val, datetime):
+        # if the datetime is naive, assume it's UTC
+        # https://docs.python.org/3/library/datetime.html#determining-if-an-object-is-aware-or-naive
+        if val.tzinfo is None or val.tzinfo.utcoffset(val) is None:
+            val = val.replace(tzinfo=timezone.utc)
+        return val.isoformat()
 
-            if isinstance(val, IPv6Address):
-                return str(val)
+    if isinstance(val, date):
+        return val.isoformat()
 
-            return val
+    if isinstance(val, IPv4Address):
+        return str(val)
 
-        d = self.model_dump(exclude_none=True)
-        if "symbol_or_symbols" in d:
-            s = d["symbol_or_symbols"]
-            if isinstance(s, list):
-                s = ",".join(s)
-            d["symbols"] = s
-            del d["symbol_or_symbols"]
+    if isinstance(val, IPv6Address):
+        return str(val)
 
-        # pydantic almost has what we need by passing exclude_none to dict() but it returns:
-        #  {trusted_contact: {}, contact: {}, identity: None, etc}
-        # so we do a simple list comprehension to filter out None and {}
-        return {
-            key: map_values(val) for key, val in d.items() if val and len(str(val)) > 0
-        }
+    return val
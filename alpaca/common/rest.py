@@ -1,19 +1,35 @@
 from collections import defaultdict
 from collections.abc import Callable
+import re
+import threading
 import time
 import base64
 from abc import ABC
-from typing import Any, Dict, List, Optional, Type, Union, Tuple, Iterator
+from typing import Any, Dict, FrozenSet, List, Optional, Type, Union, Tuple, Iterator
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from requests import Session
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import HTTPError
+from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
 from itertools import chain
+from json import JSONDecodeError, loads as stdlib_json_loads
+from urllib.parse import urlencode
+
+try:
+    # orjson is optional, it parses the larger list responses noticeably faster than the stdlib when installed
+    from orjson import loads as orjson_loads
+except ImportError:
+    orjson_loads = None
 
 from alpaca.common.constants import (
     DEFAULT_RETRY_ATTEMPTS,
     DEFAULT_RETRY_WAIT_SECONDS,
     DEFAULT_RETRY_EXCEPTION_CODES,
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    RESPONSE_CACHE_MAX_ENTRIES,
 )
 
 from alpaca import __version__
@@ -22,6 +38,34 @@ from alpaca.common.types import RawData, HTTPResult, Credentials
 from .constants import PageItem
 from .enums import PaginationType, BaseURL
 
+# the status codes are checked on every failed response, so keep them in a set
+_DEFAULT_RETRY_EXCEPTION_CODES: FrozenSet[int] = frozenset(
+    DEFAULT_RETRY_EXCEPTION_CODES
+)
+
+# orjson turns ints outside of the int64/uint64 range into floats, and any such int has at least 19 digits
+_WIDE_INT = re.compile(rb"\d{19}")
+
+
+def _json_loads(content: bytes) -> RawData:
+    """
+    Decodes a response body the way `requests.Response.json` would, raising `requests.exceptions.JSONDecodeError` on
+    a malformed body. orjson is used when installed, but bodies it would decode differently from the stdlib (wide
+    ints, NaN, ...) are left to the stdlib, so the result doesn't depend on whether orjson is installed.
+    """
+    if orjson_loads is not None and _WIDE_INT.search(content) is None:
+        try:
+            return orjson_loads(content)
+        except JSONDecodeError:
+            pass
+
+    try:
+        return stdlib_json_loads(content)
+    except JSONDecodeError as e:
+        raise RequestsJSONDecodeError(e.msg, e.doc, e.pos)
+    except UnicodeDecodeError as e:
+        raise RequestsJSONDecodeError(str(e), "", 0)
+
 
 class RESTClient(ABC):
     """Abstract base class for REST clients"""
@@ -39,6 +83,7 @@ class RESTClient(ABC):
         retry_attempts: Optional[int] = None,
         retry_wait_seconds: Optional[int] = None,
         retry_exception_codes: Optional[List[int]] = None,
+        use_response_cache: bool = True,
     ) -> None:
         """Abstract base class for REST clients. Handles submitting HTTP requests to
         Alpaca API endpoints.
@@ -56,6 +101,8 @@ class RESTClient(ABC):
             retry_attempts (Optional[int]): The number of times to retry a request that returns a RetryException.
             retry_wait_seconds (Optional[int]): The number of seconds to wait between requests before retrying.
             retry_exception_codes (Optional[List[int]]): The API exception codes to retry a request on.
+            use_response_cache (bool): Whether requests that opt in may reuse responses via ETags and the TTL cache.
+              If False every request goes to the API. Defaults to True.
         """
 
         self._api_key, self._secret_key, self._oauth_token = self._validate_credentials(
@@ -67,11 +114,18 @@ class RESTClient(ABC):
         self._use_basic_auth: bool = use_basic_auth
         self._use_raw_data: bool = raw_data
         self._session: Session = Session()
+        # url -> (etag, response body) of the last response for requests made with use_etag
+        self._etag_cache: Dict[str, Tuple[str, bytes]] = {}
+        # url -> (expiry on the monotonic clock, response body) for requests made with cache_ttl
+        self._response_cache: Dict[str, Tuple[float, bytes]] = {}
+        self._use_response_cache: bool = use_response_cache
+        # the client may be shared between threads (see BrokerClient.bulk), so writes to the caches take this lock
+        self._cache_lock = threading.Lock()
 
         # setting up request retry configurations
         self._retry: int = DEFAULT_RETRY_ATTEMPTS
         self._retry_wait: int = DEFAULT_RETRY_WAIT_SECONDS
-        self._retry_codes: List[int] = DEFAULT_RETRY_EXCEPTION_CODES
+        self._retry_codes: FrozenSet[int] = _DEFAULT_RETRY_EXCEPTION_CODES
 
         if retry_attempts and retry_attempts > 0:
             self._retry = retry_attempts
@@ -80,7 +134,19 @@ class RESTClient(ABC):
             self._retry_wait = retry_wait_seconds
 
         if retry_exception_codes:
-            self._retry_codes = retry_exception_codes
+            self._retry_codes = frozenset(retry_exception_codes)
+
+        # paging loops, concurrent fan-out and reconnecting event streams hit the same host many times in a row, so
+        # keep a larger pool of kept-alive connections around instead of re-doing the TCP and TLS handshakes for each
+        # request. urllib3 also retries failed connection attempts, before anything was sent, which is safe for every
+        # method. Retrying on status codes is still handled by _request.
+        adapter = HTTPAdapter(
+            pool_connections=DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=DEFAULT_POOL_MAXSIZE,
+            max_retries=Retry(total=self._retry, read=False),
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def _request(
         self,
@@ -89,6 +155,8 @@ class RESTClient(ABC):
         data: Optional[Union[dict, str]] = None,
         base_url: Optional[Union[BaseURL, str]] = None,
         api_version: Optional[str] = None,
+        parse_json: bool = True,
+        headers: Optional[Dict[str, str]] = None,
     ) -> HTTPResult:
         """Prepares and submits HTTP requests to given API endpoint and returns response.
         Handles retrying if 429 (Rate Limit) error arises.
@@ -100,6 +168,9 @@ class RESTClient(ABC):
              of values to be converted to appropriate format based on `method`. Defaults to None.
             base_url (Optional[Union[BaseURL, str]]): The base URL of the API. Defaults to None.
             api_version (Optional[str]): The API version. Defaults to None.
+            parse_json (bool): Whether to decode the response body as json. If False the `requests.Response` is
+             returned instead. Defaults to True.
+            headers (Optional[Dict[str, str]]): Any headers to send in addition to the default ones. Defaults to None.
 
         Returns:
             HTTPResult: The response from the API
@@ -108,10 +179,13 @@ class RESTClient(ABC):
         version = api_version if api_version else self._api_version
         url: str = base_url + "/" + version + path
 
-        headers = self._get_default_headers()
+        request_headers = self._get_default_headers()
+
+        if headers:
+            request_headers.update(headers)
 
         opts = {
-            "headers": headers,
+            "headers": request_headers,
             # Since we allow users to set endpoint URL via env var,
             # human error to put non-SSL endpoint could exploit
             # uncanny issues in non-GET request redirecting http->https.
@@ -128,7 +202,7 @@ class RESTClient(ABC):
 
         while retry >= 0:
             try:
-                return self._one_request(method, url, opts, retry)
+                return self._one_request(method, url, opts, retry, parse_json)
             except RetryException:
                 time.sleep(self._retry_wait)
                 retry -= 1
@@ -173,7 +247,9 @@ class RESTClient(ABC):
 
         return headers
 
-    def _one_request(self, method: str, url: str, opts: dict, retry: int) -> dict:
+    def _one_request(
+        self, method: str, url: str, opts: dict, retry: int, parse_json: bool = True
+    ) -> dict:
         """Perform one request, possibly raising RetryException in the case
         the response is 429. Otherwise, if error text contain "code" string,
         then it decodes to json object and returns APIError.
@@ -184,6 +260,8 @@ class RESTClient(ABC):
             url (str): The API endpoint URL
             opts (dict): Contains optional parameters including headers and parameters
             retry (int): The number of times to retry in case of RetryException
+            parse_json (bool): Whether to decode the response body as json or return the response itself. Defaults to
+             True.
 
         Raises:
             RetryException: Raised if request produces 429 error and retry limit has not been reached
@@ -206,8 +284,13 @@ class RESTClient(ABC):
 
             raise APIError(error, http_error)
 
-        if response.text != "":
-            return response.json()
+        if not parse_json:
+            return response
+
+        # decode straight from the body bytes. going through response.text and then response.json() would decode the
+        # body into a str twice (with charset detection each time) before parsing it
+        if response.content:
+            return _json_loads(response.content)
 
     def get(
         self, path: str, data: Optional[Union[dict, str]] = None, **kwargs
@@ -224,6 +307,139 @@ class RESTClient(ABC):
         """
         return self._request("GET", path, data, **kwargs)
 
+    def _get_validated(
+        self,
+        adapter: TypeAdapter,
+        path: str,
+        data: Optional[Union[dict, str]] = None,
+        use_etag: bool = False,
+        cache_ttl: Optional[float] = None,
+    ) -> Union[Any, RawData]:
+        """Performs a single GET request and validates the response with `adapter`.
+
+        The response body bytes are handed straight to pydantic-core via `validate_json`, which parses and validates
+        in one pass instead of building the intermediate dicts and lists with `json.loads` first. If the client was
+        set up to return raw data the decoded json is returned as is.
+
+        When `use_etag` is set and the API sent an ETag for the last response to the same request, it is sent back
+        as `If-None-Match` and a 304 Not Modified reuses the previously received body instead of transferring it
+        again. When `cache_ttl` is set the body is kept for that many seconds and repeated requests within that
+        window don't hit the API at all. Either way each call still returns a freshly validated instance, so callers
+        can't modify each other's results.
+
+        Args:
+            adapter (TypeAdapter): The adapter for the type the response should be validated into
+            path (str): The API endpoint path
+            data (Union[dict, str], optional): Query parameters to send, either
+            as a str urlencoded, or a dict of values to be converted. Defaults to None.
+            use_etag (bool): Whether to make the request conditional on the last seen ETag. Defaults to False.
+            cache_ttl (Optional[float]): How many seconds a response body can be reused for without asking the API
+              again. Defaults to None, which doesn't cache.
+
+        Returns:
+            Union[Any, RawData]: The validated response, or the raw response if raw_data is set
+        """
+        if not self._use_response_cache or (not use_etag and cache_ttl is None):
+            return self._request_validated("GET", adapter, path, data)
+
+        cache_key = (
+            path
+            + "?"
+            + (urlencode(data, doseq=True) if isinstance(data, dict) else data or "")
+        )
+        fresh = self._response_cache.get(cache_key) if cache_ttl is not None else None
+
+        if fresh is not None and fresh[0] > time.monotonic():
+            content = fresh[1]
+        else:
+            content = self._get_content(cache_key, path, data, use_etag)
+
+            if cache_ttl is not None:
+                self._put_bounded(
+                    self._response_cache,
+                    cache_key,
+                    (time.monotonic() + cache_ttl, content),
+                )
+
+        if self._use_raw_data:
+            return _json_loads(content) if content else None
+
+        return adapter.validate_json(content)
+
+    def _request_validated(
+        self,
+        method: str,
+        adapter: TypeAdapter,
+        path: str,
+        data: Optional[Union[dict, str]] = None,
+    ) -> Union[Any, RawData]:
+        """Performs a single request and validates the response body bytes with `adapter`, or just decodes them if
+        the client was set up to return raw data.
+
+        Args:
+            method (str): The API HTTP method
+            adapter (TypeAdapter): The adapter for the type the response should be validated into
+            path (str): The API endpoint path
+            data (Union[dict, str], optional): Either the payload in json format, query params urlencoded, or a dict
+             of values to be converted to appropriate format based on `method`. Defaults to None.
+
+        Returns:
+            Union[Any, RawData]: The validated response, or the raw response if raw_data is set
+        """
+        content = self._request(method, path, data, parse_json=False).content
+
+        if self._use_raw_data:
+            return _json_loads(content) if content else None
+
+        return adapter.validate_json(content)
+
+    def _get_content(
+        self,
+        cache_key: str,
+        path: str,
+        data: Optional[Union[dict, str]],
+        use_etag: bool,
+    ) -> bytes:
+        """
+        Private method for requesting the response body for _get_validated, conditionally on the last seen ETag if
+        `use_etag` is set.
+        """
+        if not use_etag:
+            return self._request("GET", path, data, parse_json=False).content
+
+        cached = self._etag_cache.get(cache_key)
+
+        response = self._request(
+            "GET",
+            path,
+            data,
+            parse_json=False,
+            headers={"If-None-Match": cached[0]} if cached else None,
+        )
+
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        etag = response.headers.get("ETag")
+
+        if etag:
+            self._put_bounded(self._etag_cache, cache_key, (etag, response.content))
+
+        return response.content
+
+    def _put_bounded(self, cache: Dict[str, Any], key: str, value: Any) -> None:
+        """
+        Private method for storing a value in one of the response caches, evicting the oldest entry when full.
+        """
+        # lookups are single dict operations and safe without the lock, but picking the oldest key while another
+        # thread inserts one is not
+        with self._cache_lock:
+            if key not in cache and len(cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                # evict the oldest entry, dicts keep insertion order
+                cache.pop(next(iter(cache)), None)
+
+            cache[key] = value
+
     def post(
         self, path: str, data: Optional[Union[dict, List[dict]]] = None
     ) -> HTTPResult:
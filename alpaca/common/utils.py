@@ -1,8 +1,18 @@
+from functools import lru_cache
 from typing import Union, Optional
 from uuid import UUID
 from datetime import datetime
 
 
+@lru_cache(maxsize=1024)
+def _uuid_from_str(id: str) -> UUID:
+    """
+    Parses a str into a UUID. Cached since the same ids tend to be passed in over and over (ie looping over many
+    requests for the same account), and UUID instances are immutable so they are safe to share.
+    """
+    return UUID(id)
+
+
 def validate_uuid_id_param(
     id: Union[UUID, str],
     var_name: Optional[str] = None,
@@ -20,16 +30,18 @@ def validate_uuid_id_param(
         UUID: The valid UUID instance
     """
 
-    if var_name is None:
-        var_name = "account_id"
+    # already a UUID, which is the common case for ids that came back from the api or an earlier call
+    if isinstance(id, UUID):
+        return id
 
     # should raise ValueError
-    if type(id) == str:
-        id = UUID(id)
-    elif type(id) != UUID:
-        raise ValueError(f"{var_name} must be a UUID or a UUID str")
+    if isinstance(id, str):
+        return _uuid_from_str(id)
+
+    if var_name is None:
+        var_name = "account_id"
 
-    return id
+    raise ValueError(f"{var_name} must be a UUID or a UUID str")
 
 
 def validate_symbol_or_asset_id(
@@ -17,14 +17,16 @@ class TimeSeriesMixin:
         Returns:
             DataFrame: data in a pandas dataframe
         """
+        data = self.dict()
+
         # combine all lists of data into one list
-        data_list = list(itertools.chain.from_iterable(self.dict().values()))
+        data_list = list(itertools.chain.from_iterable(data.values()))
 
         df = pd.DataFrame(data_list)
         columns = df.columns
 
         # set multi-level index
-        if "news" in self.dict():
+        if "news" in data:
             # level=0 - id
             df = df.set_index(["id"])
         elif "corporate_action_type" in columns:
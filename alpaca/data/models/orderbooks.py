@@ -16,6 +16,9 @@ class OrderbookQuote(BaseModel):
     size: float = Field(alias="s")
 
 
+_ORDERBOOK_QUOTE_LIST_ADAPTER = TypeAdapter(List[OrderbookQuote])
+
+
 class Orderbook(BaseModel):
     """Level 2 ask/bid pair orderbook data.
 
@@ -49,10 +52,10 @@ class Orderbook(BaseModel):
             if key in ORDERBOOK_MAPPING
         }
 
-        mapped_book["bids"] = TypeAdapter(List[OrderbookQuote]).validate_python(
+        mapped_book["bids"] = _ORDERBOOK_QUOTE_LIST_ADAPTER.validate_python(
             mapped_book["bids"]
         )
-        mapped_book["asks"] = TypeAdapter(List[OrderbookQuote]).validate_python(
+        mapped_book["asks"] = _ORDERBOOK_QUOTE_LIST_ADAPTER.validate_python(
             mapped_book["asks"]
         )
 
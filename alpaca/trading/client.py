@@ -45,6 +45,20 @@ from alpaca.trading.models import (
 )
 
 
+_ORDER_LIST_ADAPTER = TypeAdapter(List[Order])
+_CANCEL_ORDER_RESPONSE_LIST_ADAPTER = TypeAdapter(List[CancelOrderResponse])
+_POSITION_LIST_ADAPTER = TypeAdapter(List[Position])
+_CLOSE_POSITION_RESPONSE_LIST_ADAPTER = TypeAdapter(List[ClosePositionResponse])
+_ASSET_LIST_ADAPTER = TypeAdapter(List[Asset])
+_CALENDAR_LIST_ADAPTER = TypeAdapter(List[Calendar])
+_WATCHLIST_LIST_ADAPTER = TypeAdapter(List[Watchlist])
+_OPTION_CONTRACTS_RESPONSE_ADAPTER = TypeAdapter(OptionContractsResponse)
+_OPTION_CONTRACT_ADAPTER = TypeAdapter(OptionContract)
+_CORPORATE_ACTION_ANNOUNCEMENT_LIST_ADAPTER = TypeAdapter(
+    List[CorporateActionAnnouncement]
+)
+
+
 class TradingClient(RESTClient):
     """
     A client to interact with the trading API, in both paper and live mode.
@@ -117,17 +131,14 @@ class TradingClient(RESTClient):
             List[alpaca.trading.models.Order]: The queried orders.
         """
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
-
-        if "symbols" in params and isinstance(params["symbols"], list):
-            params["symbols"] = ",".join(params["symbols"])
+        params = filter.to_request_fields() if filter is not None else None
 
         response = self.get("/orders", params)
 
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[Order]).validate_python(response)
+        return _ORDER_LIST_ADAPTER.validate_python(response)
 
     def get_order_by_id(
         self, order_id: Union[UUID, str], filter: Optional[GetOrderByIdRequest] = None
@@ -143,7 +154,7 @@ class TradingClient(RESTClient):
             alpaca.trading.models.Order: The order that was queried.
         """
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
+        params = filter.to_request_fields() if filter is not None else None
 
         order_id = validate_uuid_id_param(order_id, "order_id")
 
@@ -212,7 +223,7 @@ class TradingClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[CancelOrderResponse]).validate_python(response)
+        return _CANCEL_ORDER_RESPONSE_LIST_ADAPTER.validate_python(response)
 
     def cancel_order_by_id(self, order_id: Union[UUID, str]) -> None:
         """
@@ -246,7 +257,7 @@ class TradingClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[Position]).validate_python(response)
+        return _POSITION_LIST_ADAPTER.validate_python(response)
 
     def get_open_position(
         self, symbol_or_asset_id: Union[UUID, str]
@@ -291,7 +302,7 @@ class TradingClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[ClosePositionResponse]).validate_python(response)
+        return _CLOSE_POSITION_RESPONSE_LIST_ADAPTER.validate_python(response)
 
     def close_position(
         self,
@@ -315,7 +326,7 @@ class TradingClient(RESTClient):
         symbol_or_asset_id = validate_symbol_or_asset_id(symbol_or_asset_id)
         response = self.delete(
             f"/positions/{symbol_or_asset_id}",
-            close_options.to_request_fields() if close_options else {},
+            close_options.to_request_fields() if close_options else None,
         )
 
         if self._use_raw_data:
@@ -363,7 +374,7 @@ class TradingClient(RESTClient):
         """
         response = self.get(
             f"/account/portfolio/history",
-            history_filter.to_request_fields() if history_filter else {},
+            history_filter.to_request_fields() if history_filter else None,
         )
 
         if self._use_raw_data:
@@ -387,14 +398,14 @@ class TradingClient(RESTClient):
             List[Asset]: The list of assets.
         """
         # checking to see if we specified at least one param
-        params = filter.to_request_fields() if filter is not None else {}
+        params = filter.to_request_fields() if filter is not None else None
 
         response = self.get(f"/assets", params)
 
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[Asset]).validate_python(response)
+        return _ASSET_LIST_ADAPTER.validate_python(response)
 
     def get_asset(self, symbol_or_asset_id: Union[UUID, str]) -> Union[Asset, RawData]:
         """
@@ -453,12 +464,12 @@ class TradingClient(RESTClient):
             List[Calendar]: A list of Calendar objects representing the market days.
         """
 
-        result = self.get("/calendar", filters.to_request_fields() if filters else {})
+        result = self.get("/calendar", filters.to_request_fields() if filters else None)
 
         if self._use_raw_data:
             return result
 
-        return TypeAdapter(List[Calendar]).validate_python(result)
+        return _CALENDAR_LIST_ADAPTER.validate_python(result)
 
     # ############################## ACCOUNT ################################# #
 
@@ -529,7 +540,7 @@ class TradingClient(RESTClient):
         if self._use_raw_data:
             return result
 
-        return TypeAdapter(List[Watchlist]).validate_python(result)
+        return _WATCHLIST_LIST_ADAPTER.validate_python(result)
 
     def get_watchlist_by_id(
         self,
@@ -684,17 +695,14 @@ class TradingClient(RESTClient):
         Returns:
             List[CorporateActionAnnouncement]: The resulting announcements from the search.
         """
-        params = filter.to_request_fields() if filter else {}
-
-        if "ca_types" in params and isinstance(params["ca_types"], list):
-            params["ca_types"] = ",".join(params["ca_types"])
+        params = filter.to_request_fields() if filter else None
 
         response = self.get("/corporate_actions/announcements", params)
 
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(List[CorporateActionAnnouncement]).validate_python(response)
+        return _CORPORATE_ACTION_ANNOUNCEMENT_LIST_ADAPTER.validate_python(response)
 
     def get_corporate_announcement_by_id(
         self, corporate_announcment_id: Union[UUID, str]
@@ -748,7 +756,7 @@ class TradingClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(OptionContractsResponse).validate_python(response)
+        return _OPTION_CONTRACTS_RESPONSE_ADAPTER.validate_python(response)
 
     def get_option_contract(
         self, symbol_or_id: Union[UUID, str]
@@ -770,4 +778,4 @@ class TradingClient(RESTClient):
         if self._use_raw_data:
             return response
 
-        return TypeAdapter(OptionContract).validate_python(response)
+        return _OPTION_CONTRACT_ADAPTER.validate_python(response)
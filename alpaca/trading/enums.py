@@ -58,7 +58,7 @@ class ActivityType(str, Enum):
             bool: returns true if this ActivityType represents a TradeActivity
         """
 
-        return self.value == self.FILL
+        return self is ActivityType.FILL
 
     @staticmethod
     def is_str_trade_activity(value: str) -> bool:
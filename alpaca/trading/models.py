@@ -26,7 +26,7 @@ from alpaca.trading.enums import (
     TradeConfirmationEmail,
     TradeEvent,
 )
-from pydantic import Field
+from pydantic import Field, field_validator
 
 
 class Asset(ModelWithID):
@@ -282,6 +282,20 @@ class ClosePositionResponse(BaseModel):
     symbol: Optional[str] = None
     body: Union[FailedClosePositionDetails, Order]
 
+    @field_validator("body", mode="before")
+    def pick_body_type(cls, value: Any) -> Any:
+        """
+        Only failures carry an error `code`, so use it to pick the model up front instead of having pydantic try
+        validating the body against both members of the union.
+        """
+        if isinstance(value, dict):
+            if "code" in value:
+                return FailedClosePositionDetails(**value)
+
+            return Order(**value)
+
+        return value
+
 
 class PortfolioHistory(BaseModel):
     """
@@ -388,12 +402,6 @@ class BaseActivity(BaseModel):
     account_id: UUID
     activity_type: ActivityType
 
-    def __init__(self, *args, **data):
-        if "account_id" in data and type(data["account_id"]) == str:
-            data["account_id"] = UUID(data["account_id"])
-
-        super().__init__(*args, **data)
-
 
 class NonTradeActivity(BaseActivity):
     """
@@ -1,7 +1,6 @@
 from datetime import date, datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
 
-import pandas as pd
 from pydantic import model_validator
 
 from alpaca.common.enums import Sort
@@ -189,6 +188,15 @@ class GetOrdersRequest(NonEmptyRequest):
     side: Optional[OrderSide] = None
     symbols: Optional[List[str]] = None
 
+    def to_request_fields(self) -> dict:
+        params = super().to_request_fields()
+
+        # API expects comma separated for symbols not multiple params
+        if "symbols" in params:
+            params["symbols"] = ",".join(self.symbols)
+
+        return params
+
 
 class GetOrderByIdRequest(NonEmptyRequest):
     """Contains data for submitting a request to retrieve a single order by its order id.
@@ -493,6 +501,10 @@ class GetCorporateAnnouncementsRequest(NonEmptyRequest):
 
     @model_validator(mode="before")
     def root_validator(cls, values: dict) -> dict:
+        # pandas is only needed here, importing it lazily keeps it out of the import time of the trading and broker
+        # clients
+        import pandas as pd
+
         since = pd.Timestamp(values.get("since")).date()
         until = pd.Timestamp(values.get("until")).date()
 
@@ -505,6 +517,15 @@ class GetCorporateAnnouncementsRequest(NonEmptyRequest):
 
         return values
 
+    def to_request_fields(self) -> dict:
+        params = super().to_request_fields()
+
+        # API expects comma separated for ca_types not multiple params
+        if "ca_types" in params:
+            params["ca_types"] = ",".join(ca_type.value for ca_type in self.ca_types)
+
+        return params
+
 
 class GetOptionContractsRequest(NonEmptyRequest):
     """
@@ -336,3 +336,43 @@ def test_get_account_activities_validates_max_items(reqmock, client: BrokerClien
     assert "max_items_limit can only be specified for PaginationType.FULL" in str(
         e.value
     )
+
+
+def test_get_account_activities_mixed_page_types(reqmock, client: BrokerClient):
+    setup_reqmock_for_paginated_account_activities_response(reqmock)
+
+    result = client.get_account_activities(
+        GetAccountActivitiesRequest(), handle_pagination=PaginationType.NONE
+    )
+
+    assert [type(activity) for activity in result] == [
+        NonTradeActivity,
+        NonTradeActivity,
+        TradeActivity,
+        NonTradeActivity,
+    ]
+
+
+def test_get_account_activities_requires_activity_type(reqmock, client: BrokerClient):
+    reqmock.get(
+        BaseURL.BROKER_SANDBOX.value + "/v1/accounts/activities",
+        text="""
+        [
+          {
+            "id": "20220419000000000::fd84741b-59c5-4ddd-a303-69f70eb7753f",
+            "account_id": "aba134b6-217d-4fd2-b460-e3c80bbfb9b4",
+            "date": "2022-04-19",
+            "net_amount": "33324.35",
+            "description": "",
+            "status": "executed"
+          }
+        ]
+        """,
+    )
+
+    with pytest.raises(ValueError) as e:
+        client.get_account_activities(
+            GetAccountActivitiesRequest(), handle_pagination=PaginationType.NONE
+        )
+
+    assert "`activity_type` is not present in fields" in str(e.value)
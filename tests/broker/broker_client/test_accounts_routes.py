@@ -128,6 +128,37 @@ def test_create_account(reqmock, client: BrokerClient):
     assert returned_account.kyc_results is None
 
 
+def test_create_account_raw_data(reqmock, raw_client: BrokerClient):
+    created_id = "0d969814-40d6-4b2b-99ac-2e37427f1ad2"
+
+    reqmock.post(
+        "https://broker-api.sandbox.alpaca.markets/v1/accounts",
+        json={
+            "id": created_id,
+            "account_number": "682389557",
+            "status": "SUBMITTED",
+            "currency": "USD",
+            "last_equity": "0",
+            "created_at": "2022-04-12T17:24:31.30283Z",
+        },
+    )
+
+    create_data = CreateAccountRequest(
+        agreements=factory.create_dummy_agreements(),
+        contact=factory.create_dummy_contact(),
+        disclosures=factory.create_dummy_disclosures(),
+        documents=factory.create_dummy_account_documents(),
+        identity=factory.create_dummy_identity(),
+        trusted_contact=factory.create_dummy_trusted_contact(),
+    )
+
+    returned_account = raw_client.create_account(create_data)
+
+    assert reqmock.called_once
+    assert isinstance(returned_account, dict)
+    assert returned_account["id"] == created_id
+
+
 def test_create_lct_account(reqmock, client: BrokerClient):
     created_id = "0d969814-40d6-4b2b-99ac-2e37427f1ad2"
 
@@ -334,6 +365,7 @@ def test_get_account(reqmock, client: BrokerClient):
     account = client.get_account_by_id(account_id)
 
     assert reqmock.called_once
+    assert reqmock.request_history[0].qs == {}
     assert type(account) == Account
     assert account.id == UUID(account_id)
 
@@ -498,6 +530,43 @@ def test_update_account(reqmock, client: BrokerClient):
     assert account.kyc_results.summary == "pass"
 
 
+def test_update_account_contact_country_only(reqmock, client: BrokerClient):
+    account_id = "0d969814-40d6-4b2b-99ac-2e37427f1ad2"
+
+    reqmock.patch(
+        f"https://broker-api.sandbox.alpaca.markets/v1/accounts/{account_id}",
+        text="""
+        {
+          "id": "0d969814-40d6-4b2b-99ac-2e37427f1ad2",
+          "account_number": "682389557",
+          "status": "ACTIVE",
+          "currency": "USD",
+          "last_equity": "0",
+          "created_at": "2022-04-12T17:24:31.30283Z",
+          "contact": {
+            "email_address": "cool_alpaca@example.com",
+            "street_address": [
+              "20 N San Mateo Dr"
+            ],
+            "city": "San Mateo",
+            "state": null,
+            "country": "USA"
+          }
+        }
+        """,
+    )
+
+    account = client.update_account(
+        account_id, UpdateAccountRequest(contact=UpdatableContact(country="USA"))
+    )
+
+    assert reqmock.called_once
+    assert reqmock.last_request.json() == {"contact": {"country": "USA"}}
+    assert isinstance(account, Account)
+    assert account.contact.country == "USA"
+    assert account.contact.state is None
+
+
 def test_update_account_validates_account_id(reqmock, client: BrokerClient):
     # dummy update request just to test param parsing
     update_data = UpdateAccountRequest()
@@ -839,6 +908,64 @@ def test_get_trade_account_by_id_validates_account_id(reqmock, client: BrokerCli
     assert "account_id must be a UUID or a UUID str" in str(e.value)
 
 
+def test_get_trade_accounts_by_ids(reqmock, client: BrokerClient):
+    account_ids = [
+        "5fc0795e-1f16-40cc-aa90-ede67c39d7a9",
+        "0d969814-40d6-4b2b-99ac-2e37427f1ad2",
+    ]
+
+    for account_id in account_ids:
+        reqmock.get(
+            BaseURL.BROKER_SANDBOX.value + f"/v1/trading/accounts/{account_id}/account",
+            json={
+                "id": account_id,
+                "account_number": "684486106",
+                "status": "ACTIVE",
+                "cash_withdrawable": "0",
+                "cash_transferable": "0",
+                "previous_close": "2022-04-13T20:00:00-04:00",
+                "last_long_market_value": "0",
+                "last_short_market_value": "0",
+                "last_cash": "0",
+                "last_initial_margin": "0",
+                "last_regt_buying_power": "0",
+                "last_daytrading_buying_power": "0",
+                "last_buying_power": "0",
+                "last_daytrade_count": 0,
+                "clearing_broker": "VELOX",
+            },
+        )
+
+    accounts = client.get_trade_accounts_by_ids(account_ids)
+
+    assert reqmock.call_count == 2
+    assert len(accounts) == 2
+    for account_id, account in zip(account_ids, accounts):
+        assert isinstance(account, TradeAccount)
+        assert account.id == UUID(account_id)
+
+
+def test_bulk_returns_results_in_order(client: BrokerClient):
+    assert client.bulk([lambda i=i: i for i in range(20)], max_workers=4) == list(
+        range(20)
+    )
+    assert client.bulk([]) == []
+
+
+def test_bulk_return_exceptions(client: BrokerClient):
+    def fail():
+        raise ValueError("boom")
+
+    results = client.bulk([lambda: 1, fail, lambda: 3], return_exceptions=True)
+
+    assert results[0] == 1
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 3
+
+    with pytest.raises(ValueError):
+        client.bulk([lambda: 1, fail])
+
+
 def test_get_trade_configuration_for_account(reqmock, client: BrokerClient):
     account_id = "5fc0795e-1f16-40cc-aa90-ede67c39d7a9"
 
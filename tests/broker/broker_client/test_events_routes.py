@@ -0,0 +1,175 @@
+import asyncio
+import io
+import socket
+import threading
+from typing import Iterator, List
+
+import pytest
+from requests.exceptions import ChunkedEncodingError
+
+from alpaca.broker.client import BrokerClient, _iter_sse_events
+from alpaca.broker.requests import GetEventsRequest
+from alpaca.common.enums import BaseURL
+
+
+class ChunkedResponse:
+    """Stands in for a streamed response that delivers its body in the given chunks."""
+
+    def __init__(self, chunks: List[bytes]) -> None:
+        self.chunks = chunks
+
+    def iter_content(self, chunk_size=None) -> Iterator[bytes]:
+        return iter(self.chunks)
+
+
+class EventStream(io.BytesIO):
+    """A body that closes itself once drained, the way a socket backed body does when the server ends the stream."""
+
+    def read(self, *args) -> bytes:
+        data = super().read(*args)
+
+        if not data:
+            self.close()
+
+        return data
+
+
+class BlockingEventStream(io.BytesIO):
+    """A body that, once drained, blocks the way an idle event stream does until it is released or closed."""
+
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.released = threading.Event()
+        self.closed_event = threading.Event()
+
+    def read(self, *args) -> bytes:
+        data = super().read(*args)
+
+        if not data:
+            self.released.wait(5)
+
+        return data
+
+    read1 = read
+
+    def close(self) -> None:
+        super().close()
+        self.closed_event.set()
+
+
+def test_get_account_status_events(reqmock, client: BrokerClient):
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/events/accounts/status",
+        body=EventStream(
+            b": heartbeat\n\n"
+            b'data: {"event_id": 1}\n\n'
+            b'id: 2\ndata: {"event_id": 2}\n\n'
+        ),
+    )
+
+    events = list(
+        client.get_account_status_events(GetEventsRequest(since="2022-01-01"))
+    )
+
+    assert reqmock.called_once
+    assert reqmock.last_request.qs == {"since": ["2022-01-01"]}
+    assert reqmock.last_request.headers["Accept"] == "text/event-stream"
+    assert events == ['{"event_id": 1}', '{"event_id": 2}']
+
+
+@pytest.mark.asyncio
+async def test_get_trade_events_async(reqmock, client: BrokerClient):
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/events/trades",
+        body=EventStream(b'data: {"event_id": 1}\n\ndata: {"event_id": 2}\n\n'),
+    )
+
+    events = [event async for event in client.get_trade_events_async()]
+
+    assert reqmock.called_once
+    assert reqmock.last_request.headers["Accept"] == "text/event-stream"
+    assert events == ['{"event_id": 1}', '{"event_id": 2}']
+
+
+@pytest.mark.asyncio
+async def test_get_trade_events_async_closes_stream_on_cancel(
+    reqmock, client: BrokerClient
+):
+    body = BlockingEventStream(b'data: {"event_id": 1}\n\n')
+    reqmock.get(f"{BaseURL.BROKER_SANDBOX.value}/v1/events/trades", body=body)
+
+    received = asyncio.Queue()
+
+    async def consume():
+        async for event in client.get_trade_events_async():
+            await received.put(event)
+
+    task = asyncio.create_task(consume())
+
+    assert await asyncio.wait_for(received.get(), 5) == '{"event_id": 1}'
+
+    # the consumer is now waiting on a read that's blocked in the stream's own thread
+    assert await client._run_async(lambda: "default executor is free") is not None
+
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    # stands in for the socket shutdown that wakes the blocked read of a real connection
+    body.released.set()
+
+    assert await asyncio.get_running_loop().run_in_executor(
+        None, body.closed_event.wait, 5
+    )
+
+
+def test_iter_sse_events_across_chunks():
+    response = ChunkedResponse(
+        [
+            b"data: fir",
+            b"st\r\n\r",
+            b"\ndata: second\ndata:",
+            b" line\n",
+            b"\ndata: last",
+        ]
+    )
+
+    assert list(_iter_sse_events(response)) == ["first", "second\nline", "last"]
+
+
+def test_get_trade_events_raises_requests_error_on_truncated_stream():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+
+    def serve_truncated_stream():
+        connection, _ = server.accept()
+
+        with connection:
+            connection.recv(65536)
+            connection.sendall(
+                b"HTTP/1.1 200 OK\r\n"
+                b"Content-Type: text/event-stream\r\n"
+                b"Transfer-Encoding: chunked\r\n\r\n"
+                b'11\r\ndata: {"id": 1}\n\n\r\n'
+                # promises 0x20 bytes but hangs up after a few of them
+                b"20\r\ndata:"
+            )
+
+    thread = threading.Thread(target=serve_truncated_stream, daemon=True)
+    thread.start()
+
+    host, port = server.getsockname()
+    client = BrokerClient("key-id", "secret-key", url_override=f"http://{host}:{port}")
+
+    try:
+        events = client.get_trade_events()
+
+        assert next(events) == '{"id": 1}'
+
+        with pytest.raises(ChunkedEncodingError):
+            next(events)
+    finally:
+        thread.join(5)
+        server.close()
@@ -1,6 +1,9 @@
+import asyncio
 from typing import Iterator
 from uuid import UUID
 
+import pytest
+
 from alpaca.broker.client import BrokerClient
 from alpaca.broker.enums import (
     ACHRelationshipStatus,
@@ -210,6 +213,120 @@ def test_get_banks_for_account(reqmock, client: BrokerClient):
     assert isinstance(banks[0], Bank)
 
 
+def test_get_banks_for_account_raw_data(reqmock, raw_client: BrokerClient):
+    account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/accounts/{account_id}/recipient_banks",
+        text="""
+        [
+            {
+              "id": "9a7fb9b5-1f4d-420f-b6d4-0fd32008cec8",
+              "account_id": "2a87c088-ffb6-472b-a4a3-cd9305c8605c",
+              "name": "my bank detail",
+              "status": "QUEUED"
+            }
+        ]
+        """,
+    )
+
+    banks = raw_client.get_banks_for_account(account_id)
+
+    assert reqmock.called_once
+    assert banks == [
+        {
+            "id": "9a7fb9b5-1f4d-420f-b6d4-0fd32008cec8",
+            "account_id": "2a87c088-ffb6-472b-a4a3-cd9305c8605c",
+            "name": "my bank detail",
+            "status": "QUEUED",
+        }
+    ]
+
+
+def test_get_banks_for_account_uses_etag(reqmock, client: BrokerClient):
+    account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+    body = """
+        [
+            {
+              "id": "9a7fb9b5-1f4d-420f-b6d4-0fd32008cec8",
+              "account_id": "2a87c088-ffb6-472b-a4a3-cd9305c8605c",
+              "name": "my bank detail",
+              "status": "QUEUED",
+              "country": "",
+              "state_province": "",
+              "postal_code": "",
+              "city": "",
+              "street_address": "",
+              "account_number": "123456789abc",
+              "bank_code": "123456789",
+              "bank_code_type": "ABA",
+              "created_at": "2021-01-09T12:14:18.683915267Z",
+              "updated_at": "2021-01-09T12:14:18.683915267Z"
+            }
+        ]
+        """
+
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/accounts/{account_id}/recipient_banks",
+        [
+            {"text": body, "headers": {"ETag": '"abc"'}},
+            {"status_code": 304, "text": ""},
+        ],
+    )
+
+    first = client.get_banks_for_account(account_id)
+    second = client.get_banks_for_account(account_id)
+
+    assert reqmock.call_count == 2
+    assert "If-None-Match" not in reqmock.request_history[0].headers
+    assert reqmock.request_history[1].headers["If-None-Match"] == '"abc"'
+    assert isinstance(second[0], Bank)
+    assert first == second
+    assert first[0] is not second[0]
+
+
+@pytest.mark.asyncio
+async def test_get_banks_for_account_async(reqmock, client: BrokerClient):
+    account_ids = [
+        "2a87c088-ffb6-472b-a4a3-cd9305c8605c",
+        "0d969814-40d6-4b2b-99ac-2e37427f1ad2",
+    ]
+
+    for account_id in account_ids:
+        reqmock.get(
+            f"{BaseURL.BROKER_SANDBOX.value}/v1/accounts/{account_id}/recipient_banks",
+            text=f"""
+            [
+                {{
+                  "id": "9a7fb9b5-1f4d-420f-b6d4-0fd32008cec8",
+                  "account_id": "{account_id}",
+                  "name": "my bank detail",
+                  "status": "QUEUED",
+                  "country": "",
+                  "state_province": "",
+                  "postal_code": "",
+                  "city": "",
+                  "street_address": "",
+                  "account_number": "123456789abc",
+                  "bank_code": "123456789",
+                  "bank_code_type": "ABA",
+                  "created_at": "2021-01-09T12:14:18.683915267Z",
+                  "updated_at": "2021-01-09T12:14:18.683915267Z"
+                }}
+            ]
+            """,
+        )
+
+    results = await asyncio.gather(
+        *[client.get_banks_for_account_async(account_id) for account_id in account_ids]
+    )
+
+    assert reqmock.call_count == 2
+    for account_id, banks in zip(account_ids, results):
+        assert isinstance(banks[0], Bank)
+        assert banks[0].account_id == UUID(account_id)
+
+
 def test_delete_bank_for_account(reqmock, client: BrokerClient):
     account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
     bank_id = "15ef9978-cb1e-4872-9565-bd0a720b8b76"
@@ -423,6 +540,36 @@ def test_get_transfers_for_account_full_pagination_and_max_items(
     assert isinstance(transfers[0], Transfer)
 
 
+def test_get_transfers_for_account_walks_past_short_page(reqmock, client: BrokerClient):
+    account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+    setup_reqmock_for_paginated_transfers_response(account_id, reqmock)
+
+    transfers = client.get_transfers_for_account(
+        account_id, transfers_filter=GetTransfersRequest(limit=4, offset=2)
+    )
+
+    # a page shorter than the limit isn't necessarily the last one, only the empty page ends the walk
+    assert reqmock.call_count == 3
+    assert reqmock.request_history[0].qs == {"limit": ["4"], "offset": ["2"]}
+    assert reqmock.request_history[1].qs == {"limit": ["4"], "offset": ["5"]}
+    assert reqmock.request_history[2].qs == {"limit": ["4"], "offset": ["8"]}
+    assert len(transfers) == 6
+
+
+def test_iterate_transfers_for_account(reqmock, client: BrokerClient):
+    account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+    setup_reqmock_for_paginated_transfers_response(account_id, reqmock)
+
+    iterator = client.iterate_transfers_for_account(account_id)
+
+    assert reqmock.call_count == 0
+    assert isinstance(next(iterator), Transfer)
+    assert reqmock.call_count == 1
+
+    assert len(list(iterator)) == 5
+    assert reqmock.call_count == 3
+
+
 def test_get_transfers_for_account_none_pagination(reqmock, client: BrokerClient):
     account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
     setup_reqmock_for_paginated_transfers_response(account_id, reqmock)
@@ -499,3 +646,72 @@ def test_cancel_transfer_for_account(reqmock, client: BrokerClient):
 
     assert client.cancel_transfer_for_account(account_id, transfer_id) is None
     assert reqmock.called_once
+
+
+@pytest.mark.asyncio
+async def test_get_transfers_for_account_async_follows_returned_page_sizes(
+    reqmock, client: BrokerClient
+):
+    account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+    transfer = {
+        "id": "bf438b6d-4ea3-4241-9e1c-a0e55b47f4e0",
+        "account_id": account_id,
+        "type": "wire",
+        "status": "COMPLETE",
+        "currency": "USD",
+        "amount": "100",
+        "instant_amount": "0",
+        "direction": "INCOMING",
+        "created_at": "2024-07-15T13:40:01.963459Z",
+        "updated_at": "2024-07-22T08:22:29.990176Z",
+        "reason": None,
+        "hold_until": None,
+        "requested_amount": "100",
+        "fee": "0",
+        "fee_payment_method": "user",
+    }
+    total_transfers = 5
+
+    # the api hands back fewer transfers than the requested limit on every page
+    def transfers_page(request, context):
+        offset = int(request.qs["offset"][0])
+        return [transfer] * min(1, total_transfers - offset)
+
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/accounts/{account_id}/transfers",
+        json=transfers_page,
+    )
+
+    transfers = await client.get_transfers_for_account_async(
+        account_id, GetTransfersRequest(limit=2), max_items_limit=10
+    )
+
+    assert [int(request.qs["offset"][0]) for request in reqmock.request_history] == [
+        0,
+        1,
+        2,
+        3,
+        4,
+        5,
+    ]
+    assert len(transfers) == total_transfers
+    assert all(isinstance(transfer, Transfer) for transfer in transfers)
+
+
+@pytest.mark.asyncio
+async def test_get_transfers_for_account_async_stops_on_non_list_response(
+    reqmock, client: BrokerClient
+):
+    account_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/accounts/{account_id}/transfers",
+        text="null",
+    )
+
+    transfers = await client.get_transfers_for_account_async(
+        account_id, GetTransfersRequest(limit=2), max_items_limit=10
+    )
+
+    assert reqmock.call_count == 1
+    assert transfers == []
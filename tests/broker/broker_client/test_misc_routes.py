@@ -1,6 +1,8 @@
+from functools import partial
 from typing import List
 
 from alpaca.broker.client import BrokerClient
+from alpaca.common.constants import RESPONSE_CACHE_MAX_ENTRIES
 from alpaca.common.enums import BaseURL
 from alpaca.trading.models import Calendar, Clock
 from alpaca.trading.requests import GetCalendarRequest
@@ -64,3 +66,149 @@ def test_get_clock(reqmock, client: BrokerClient):
 
     assert reqmock.called_once
     assert isinstance(result, Clock)
+
+
+def test_basic_auth_header(reqmock, client: BrokerClient):
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/clock",
+        text="""
+        {
+          "timestamp": "2022-05-16T16:32:24.14373588-04:00",
+          "is_open": false,
+          "next_open": "2022-05-17T09:30:00-04:00",
+          "next_close": "2022-05-17T16:00:00-04:00"
+        }
+        """,
+    )
+
+    client.get_clock()
+    client.get_clock()
+
+    # base64 of "key-id:secret-key"
+    expected = "Basic a2V5LWlkOnNlY3JldC1rZXk="
+    assert reqmock.call_count == 2
+    for request in reqmock.request_history:
+        assert request.headers["Authorization"] == expected
+
+
+def test_get_calendar_uses_etag(reqmock, client: BrokerClient):
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/calendar",
+        [
+            {
+                "text": """
+                [
+                  {
+                    "date": "2022-05-16",
+                    "open": "09:30",
+                    "close": "16:00",
+                    "session_open": "0400",
+                    "session_close": "2000"
+                  }
+                ]
+                """,
+                "headers": {"ETag": '"calendar-v1"'},
+            },
+            {"status_code": 304},
+        ],
+    )
+
+    first = client.get_calendar()
+    # expire the cached body so the second call has to revalidate with the api
+    client._response_cache.clear()
+    second = client.get_calendar()
+
+    assert reqmock.call_count == 2
+    assert "If-None-Match" not in reqmock.request_history[0].headers
+    assert reqmock.request_history[1].headers["If-None-Match"] == '"calendar-v1"'
+    assert isinstance(second[0], Calendar)
+    assert first == second
+
+
+def test_get_calendar_is_cached(reqmock, client: BrokerClient):
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/calendar",
+        text="""
+        [
+          {
+            "date": "2022-05-16",
+            "open": "09:30",
+            "close": "16:00",
+            "session_open": "0400",
+            "session_close": "2000"
+          }
+        ]
+        """,
+    )
+
+    first = client.get_calendar(GetCalendarRequest(start="2022-05-16"))
+    second = client.get_calendar(GetCalendarRequest(start="2022-05-16"))
+    other = client.get_calendar(GetCalendarRequest(start="2022-05-17"))
+
+    assert reqmock.call_count == 2
+    assert first == second
+    assert first[0] is not second[0]
+    assert isinstance(other[0], Calendar)
+
+
+def test_get_calendar_bypasses_cache(reqmock, client: BrokerClient):
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/calendar",
+        text="""
+        [
+          {
+            "date": "2022-05-16",
+            "open": "09:30",
+            "close": "16:00",
+            "session_open": "0400",
+            "session_close": "2000"
+          }
+        ]
+        """,
+    )
+
+    client.get_calendar()
+    calendar = client.get_calendar(use_cache=False)
+
+    assert reqmock.call_count == 2
+    assert isinstance(calendar[0], Calendar)
+
+
+def test_get_calendar_without_response_cache(reqmock):
+    client = BrokerClient("key-id", "secret-key", use_response_cache=False)
+
+    reqmock.get(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/calendar",
+        text="""
+        [
+          {
+            "date": "2022-05-16",
+            "open": "09:30",
+            "close": "16:00",
+            "session_open": "0400",
+            "session_close": "2000"
+          }
+        ]
+        """,
+        headers={"ETag": '"calendar-v1"'},
+    )
+
+    client.get_calendar()
+    client.get_calendar()
+
+    assert reqmock.call_count == 2
+    assert all(
+        "If-None-Match" not in request.headers for request in reqmock.request_history
+    )
+    assert client._response_cache == {}
+    assert client._etag_cache == {}
+
+
+def test_response_cache_stays_bounded_across_threads(client: BrokerClient):
+    def fill(thread_index: int):
+        for i in range(RESPONSE_CACHE_MAX_ENTRIES):
+            client._put_bounded(client._response_cache, f"{thread_index}-{i}", i)
+
+    client.bulk([partial(fill, thread_index) for thread_index in range(8)])
+
+    assert len(client._response_cache) == RESPONSE_CACHE_MAX_ENTRIES
@@ -1,6 +1,7 @@
 import datetime
 from alpaca.broker.client import BrokerClient
 from alpaca.common.enums import BaseURL
+from alpaca.common.exceptions import APIError
 from alpaca.trading.requests import (
     CancelOrderResponse,
     ClosePositionRequest,
@@ -635,3 +636,63 @@ def test_cancel_orders_for_account(reqmock, client: BrokerClient):
     assert res[1].body is not None
     assert res[1].body["code"] == 40410000
     assert res[1].body["message"] == "order not found"
+
+
+def test_cancel_orders_for_accounts(reqmock, client: BrokerClient):
+    account_ids = [
+        "2a87c088-ffb6-472b-a4a3-cd9305c8605c",
+        "0d969814-40d6-4b2b-99ac-2e37427f1ad2",
+    ]
+
+    for account_id in account_ids:
+        reqmock.delete(
+            f"{BaseURL.BROKER_SANDBOX.value}/v1/trading/accounts/{account_id}/orders",
+            text="""
+            [
+                {
+                    "id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+                    "status": 200
+                }
+            ]
+            """,
+        )
+
+    res = client.cancel_orders_for_accounts(account_ids)
+
+    assert reqmock.call_count == 2
+    assert list(res.keys()) == [UUID(account_id) for account_id in account_ids]
+    assert all(
+        isinstance(responses[0], CancelOrderResponse) for responses in res.values()
+    )
+
+
+def test_cancel_orders_for_accounts_keeps_results_when_one_fails(
+    reqmock, client: BrokerClient
+):
+    cancelled_id = "2a87c088-ffb6-472b-a4a3-cd9305c8605c"
+    failed_id = "0d969814-40d6-4b2b-99ac-2e37427f1ad2"
+
+    reqmock.delete(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/trading/accounts/{cancelled_id}/orders",
+        text="""
+        [
+            {
+                "id": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+                "status": 200
+            }
+        ]
+        """,
+    )
+    reqmock.delete(
+        f"{BaseURL.BROKER_SANDBOX.value}/v1/trading/accounts/{failed_id}/orders",
+        status_code=403,
+        text='{"code": 40310000, "message": "account is not active"}',
+    )
+
+    res = client.cancel_orders_for_accounts([cancelled_id, failed_id, cancelled_id])
+
+    assert reqmock.call_count == 2
+    assert list(res.keys()) == [UUID(cancelled_id), UUID(failed_id)]
+    assert isinstance(res[UUID(cancelled_id)][0], CancelOrderResponse)
+    assert isinstance(res[UUID(failed_id)], APIError)
+    assert res[UUID(failed_id)].status_code == 403
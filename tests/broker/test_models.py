@@ -13,9 +13,11 @@ from alpaca.broker.requests import (
 )
 from alpaca.broker.models import (
     AccountDocument,
+    Contact,
     TradeDocument,
 )
 from alpaca.broker.requests import (
+    CreateAccountRequest,
     UpdateAccountRequest,
     UpdatableTrustedContact,
     UpdatableContact,
@@ -23,17 +25,20 @@ from alpaca.broker.requests import (
     UpdatableDisclosures,
     GetAccountActivitiesRequest,
     GetTradeDocumentsRequest,
+    ListAccountsRequest,
     CreateBankRequest,
     CreateACHTransferRequest,
     CreateBankTransferRequest,
 )
 from alpaca.broker.enums import (
+    AccountEntities,
     IdentifierType,
     TransferType,
     TransferDirection,
     TransferTiming,
     JournalEntryType,
 )
+from tests.broker.factories import accounts as factory
 from tests.broker.factories import create_dummy_w8ben_document
 from uuid import uuid4
 
@@ -63,6 +68,26 @@ def test_document_validates_id():
         )
 
 
+def test_create_account_request_requires_state_for_usa_contact():
+    contact = factory.create_dummy_contact()
+    contact.country = "USA"
+    contact.state = None
+
+    # responses and partial updates may leave the state out
+    assert Contact(**contact.model_dump()).state is None
+    assert UpdatableContact(country="USA").state is None
+
+    with pytest.raises(ValueError) as e:
+        CreateAccountRequest(
+            contact=contact,
+            identity=factory.create_dummy_identity(),
+            disclosures=factory.create_dummy_disclosures(),
+            agreements=factory.create_dummy_agreements(),
+        )
+
+    assert "State is required for country USA." in str(e.value)
+
+
 def test_account_update_request_to_request_fields():
     name = "TEST"
     req = UpdateAccountRequest(trusted_contact=UpdatableTrustedContact(given_name=name))
@@ -83,6 +108,18 @@ def test_account_update_request_to_request_fields():
     assert {} == empty_req.to_request_fields()
 
 
+def test_list_accounts_request_joins_entities():
+    req = ListAccountsRequest(
+        entities=[AccountEntities.CONTACT, AccountEntities.USER_CONFIGURATIONS]
+    )
+
+    assert req.to_request_fields() == {
+        "sort": "desc",
+        "entities": "contact,trading_configurations",
+    }
+    assert "entities" not in ListAccountsRequest().to_request_fields()
+
+
 def test_get_account_activities_request_validates_date_parameters_for_conflicts():
     req = GetAccountActivitiesRequest(date=datetime.now())
 
@@ -25,6 +25,7 @@ from alpaca.trading.enums import (
 from alpaca.trading.models import (
     Position,
     ClosePositionResponse,
+    FailedClosePositionDetails,
     Order,
 )
 from factories import create_dummy_order
@@ -110,6 +111,21 @@ def test_close_position_response_uuid():
     assert isinstance(close_position_response.symbol, str)
 
 
+def test_close_position_response_body_type():
+    """Tests that the body is parsed into the failure details or an Order depending on its contents."""
+    failed = ClosePositionResponse(
+        symbol="SQQQ",
+        status=403,
+        body={"code": 40310000, "message": "insufficient qty available for order"},
+    )
+    succeeded = ClosePositionResponse(
+        symbol="AAPL", status=200, body=create_dummy_order().model_dump()
+    )
+
+    assert isinstance(failed.body, FailedClosePositionDetails)
+    assert isinstance(succeeded.body, Order)
+
+
 def test_order_timestamps():
     """Tests that all timestamp fields are up-casted to datetimes."""
 
@@ -0,0 +1,63 @@
+import pytest
+from requests.exceptions import JSONDecodeError, RequestException
+
+from alpaca.common.constants import (
+    DEFAULT_POOL_CONNECTIONS,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_RETRY_ATTEMPTS,
+    DEFAULT_RETRY_EXCEPTION_CODES,
+)
+from alpaca.common.enums import BaseURL
+from alpaca.common.rest import RESTClient
+from alpaca.trading.client import TradingClient
+
+
+def test_session_uses_connection_pool(trading_client: TradingClient):
+    adapter = trading_client._session.get_adapter(BaseURL.TRADING_PAPER.value)
+
+    assert adapter._pool_connections == DEFAULT_POOL_CONNECTIONS
+    assert adapter._pool_maxsize == DEFAULT_POOL_MAXSIZE
+    assert adapter.max_retries.connect is None
+    assert adapter.max_retries.total == DEFAULT_RETRY_ATTEMPTS
+    assert adapter.max_retries.read is False
+
+
+def test_retry_exception_codes():
+    assert DEFAULT_RETRY_EXCEPTION_CODES == [429, 504]
+
+    default_client = RESTClient(BaseURL.TRADING_PAPER, "key-id", "secret-key")
+    custom_client = RESTClient(
+        BaseURL.TRADING_PAPER,
+        "key-id",
+        "secret-key",
+        retry_exception_codes=[500, 503],
+    )
+
+    assert default_client._retry_codes == frozenset(DEFAULT_RETRY_EXCEPTION_CODES)
+    assert custom_client._retry_codes == frozenset([500, 503])
+
+
+@pytest.mark.parametrize("body", [b"{not json", b'"\xff"'])
+def test_malformed_response_raises_requests_json_error(
+    reqmock, trading_client: TradingClient, body: bytes
+):
+    reqmock.get(f"{BaseURL.TRADING_PAPER.value}/v2/account", content=body)
+
+    with pytest.raises(JSONDecodeError) as exc_info:
+        trading_client.get("/account")
+
+    assert isinstance(exc_info.value, RequestException)
+
+
+@pytest.mark.parametrize(
+    "value", [123456789012345678901234567890, -9223372036854775809]
+)
+def test_response_with_wide_int_is_decoded(
+    reqmock, trading_client: TradingClient, value: int
+):
+    reqmock.get(
+        f"{BaseURL.TRADING_PAPER.value}/v2/account",
+        text=f'{{"id": {value}}}',
+    )
+
+    assert trading_client.get("/account") == {"id": value}
@@ -1,5 +1,11 @@
-from alpaca.trading.enums import OrderSide, OrderType, TimeInForce
+from alpaca.trading.enums import (
+    CorporateActionType,
+    OrderSide,
+    OrderType,
+    TimeInForce,
+)
 from alpaca.trading.requests import (
+    GetCorporateAnnouncementsRequest,
     MarketOrderRequest,
     TrailingStopOrderRequest,
     LimitOrderRequest,
@@ -75,3 +81,13 @@ def test_trailing_stop_order_type():
         )
 
     assert "Both trail_percent and trail_price cannot be set." in str(e.value)
+
+
+def test_corporate_announcements_request_joins_ca_types():
+    request = GetCorporateAnnouncementsRequest(
+        ca_types=[CorporateActionType.DIVIDEND, CorporateActionType.SPLIT],
+        since="2022-01-01",
+        until="2022-02-01",
+    )
+
+    assert request.to_request_fields()["ca_types"] == "dividend,split"
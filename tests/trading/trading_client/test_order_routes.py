@@ -126,6 +126,7 @@ def test_get_orders(reqmock, trading_client: TradingClient):
 
     response = trading_client.get_orders(get_orders_request)
 
+    assert reqmock.last_request.qs == {"symbols": ["spy,aapl"]}
     assert type(response) is list
     assert type(response[0]) is Order
 